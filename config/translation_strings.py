@@ -175,19 +175,25 @@ class LanguageManager:
     """
     def __init__(self):
         self.current_lang = "EN" # Default language
+        # Dizionario della lingua corrente, risolto una sola volta per set_language
+        self._strings = TRANSLATIONS["EN"]
         
     def set_language(self, lang_code):
         """Imposta la lingua (IT o EN)."""
         if lang_code in TRANSLATIONS:
             self.current_lang = lang_code
+            self._strings = TRANSLATIONS[lang_code]
             
     def get(self, key):
         """
         Restituisce la traduzione per la chiave richiesta.
         Se la chiave non esiste, restituisce un placeholder per debug.
         """
-        lang_dict = TRANSLATIONS.get(self.current_lang, TRANSLATIONS["EN"])
-        return lang_dict.get(key, f"MISSING: {key}")
+        text = self._strings.get(key)
+        if text is None:
+            # Il placeholder viene formattato solo per le chiavi mancanti
+            return f"MISSING: {key}"
+        return text
 
 # Global instance to import into other files
 i18n = LanguageManager()
\ No newline at end of file
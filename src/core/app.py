@@ -173,20 +173,8 @@ class SpotterApp:
                 else:
                     pose_data = last_pose_data  # Reuse previous inference
                 
-                # 3. Logic (Update State)
-                # Pass current time for smoothing algorithms
-                ui_state = self.session_manager.update(pose_data, time.time())
-                
-                # 4. Render & Output (Delegate to Sink)
-                ui_state.language = self.config.get('language', 'IT')
-                ui_state.feedback_key = i18n.get(ui_state.feedback_key) if ui_state.feedback_key else ""
-                if ui_state.state_display:
-                    ui_state.state_display = ui_state.state_display._replace(
-                        label_key=i18n.get(ui_state.state_display.label_key)
-                    )
-                    
-                state_json = json.dumps(ui_state.to_dict())
-                self.output_sink.emit(frame, state_json)
+                # 3-4. Logic + Output
+                self._process_one_frame(frame, pose_data)
                 
                 # 5. Input Handlers
                 self._handle_input()
@@ -202,6 +190,29 @@ class SpotterApp:
         finally:
             self._cleanup()
 
+    def _process_one_frame(self, frame, pose_data) -> None:
+        """
+        Updates the session with one frame's pose data and emits the result.
+        
+        Args:
+            frame: Raw BGR frame, forwarded to the output sink
+            pose_data: Raw pose detection results for this frame
+        """
+        # 3. Logic (Update State)
+        # Pass current (monotonic) time for smoothing algorithms
+        ui_state = self.session_manager.update(pose_data, time.monotonic())
+        
+        # 4. Render & Output (Delegate to Sink)
+        ui_state.language = self.config.get('language', 'IT')
+        ui_state.feedback_key = i18n.get(ui_state.feedback_key) if ui_state.feedback_key else ""
+        if ui_state.state_display:
+            ui_state.state_display = ui_state.state_display._replace(
+                label_key=i18n.get(ui_state.state_display.label_key)
+            )
+            
+        state_json = json.dumps(ui_state.to_dict())
+        self.output_sink.emit(frame, state_json)
+
     def _handle_input(self):
         try:
             cmd = self.command_queue.get_nowait()
@@ -14,12 +14,20 @@ class ExerciseConfig(TypedDict, total=False):
     - Curl/Squat/PushUp: side, up_angle, down_angle
     - PushUp: form_angle_min
     - Plank: stability_duration
+    - All: smoothing_min_cutoff, smoothing_beta
+    
+    smoothing_min_cutoff / smoothing_beta tune the One Euro filter on the
+    exercise keypoints (lower cutoff = smoother but more lag, higher beta =
+    less lag during movement). Defaults: SMOOTHING_MIN_CUTOFF / SMOOTHING_BETA
+    in config/settings.py.
     """
     side: str                    # "left", "right", "both"
     up_angle: float              # Angle threshold for UP state
     down_angle: float            # Angle threshold for DOWN state
     form_angle_min: float        # Min body angle for form check (PushUp)
     stability_duration: float    # Hold duration before active (Plank)
+    smoothing_min_cutoff: float  # Keypoint filter min cutoff (Hz)
+    smoothing_beta: float        # Keypoint filter speed coefficient
 
 
 class AppConfig(TypedDict):
@@ -9,6 +9,19 @@ import numpy as np
 from src.core.interfaces import StateDisplayInfo
 
 
+def _keypoints_payload(keypoints: np.ndarray) -> list:
+    """
+    Rounds (x, y) to whole pixels in one vectorized pass, so the per-frame
+    JSON stays compact. Confidence is sent unrounded: the client compares
+    it against its visibility threshold, and rounding could flip that test.
+    """
+    if keypoints.ndim != 2 or keypoints.shape[1] < 3:
+        return keypoints.tolist()
+    kp = keypoints.astype(np.float64)
+    np.rint(kp[:, :2], out=kp[:, :2])
+    return kp.tolist()
+
+
 @dataclass
 class UIState:
     """State object passed to the UI layer for rendering."""
@@ -41,7 +54,7 @@ class UIState:
             "is_time_based": self.is_time_based,
             "is_valid": self.is_valid,
             "invalid_joints": self.invalid_joints,
-            "keypoints": self.keypoints.tolist() if self.keypoints is not None else None,
+            "keypoints": _keypoints_payload(self.keypoints) if self.keypoints is not None else None,
             "state_display": {
                 "label_key": self.state_display.label_key,
                 "color": self.state_display.color,
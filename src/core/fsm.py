@@ -6,10 +6,14 @@ Thread-safe design for potential async processing.
 """
 import logging
 import threading
-from collections import deque
 from enum import Enum
-from typing import Tuple, Callable, Optional
+from typing import List, Tuple, Optional
+
+import numpy as np
+
 from config.settings import HYSTERESIS_TOLERANCE, FSM_STABILITY_FRAMES
+from src.utils.geometry import mean_triplet_angle
+from src.utils.jit import njit
 
 
 class RepPhase(Enum):
@@ -24,12 +28,102 @@ class RepPhase(Enum):
     UNKNOWN = "unknown"
 
 
+# Integer phase codes used by the compiled step kernel
+_PHASE_START = 0
+_PHASE_UP = 1
+_PHASE_DOWN = 2
+_PHASE_UNKNOWN = 3
+_CODE_TO_PHASE = (RepPhase.START, RepPhase.UP, RepPhase.DOWN, RepPhase.UNKNOWN)
+_PHASE_TO_CODE = {phase: code for code, phase in enumerate(_CODE_TO_PHASE)}
+
+
+@njit("UniTuple(int64, 4)(float64, int64, int64, int64, float64, float64, float64, int64)",
+      cache=True)
+def _fsm_step(angle: float, phase: int, down_run: int, up_run: int,
+              down_limit: float, up_limit: float, sign: float,
+              stability_frames: int) -> Tuple[int, int, int, int]:
+    """
+    One RepetitionCounter step on integer phase codes (compiled by Numba when available).
+    
+    Angles are compared in "signed" space (sign=-1 for inverted exercises), so
+    a single rule covers both directions:
+        DOWN zone: sign*angle < down_limit
+        UP zone:   sign*angle > up_limit
+    down_run/up_run count consecutive frames inside each zone (debouncing).
+    
+    Returns:
+        (new_phase, down_run, up_run, rep_delta)
+    """
+    signed = sign * angle
+    in_down = signed < down_limit
+    in_up = signed > up_limit
+    
+    # Consecutive-frame counters, saturating at stability_frames
+    down_run = min(down_run + 1, stability_frames) * in_down
+    up_run = min(up_run + 1, stability_frames) * in_up
+    
+    rep_delta = 0
+    if in_down:
+        if down_run >= stability_frames:
+            phase = _PHASE_DOWN
+    elif in_up and up_run >= stability_frames:
+        if phase == _PHASE_DOWN:
+            rep_delta = 1
+            phase = _PHASE_UP
+        elif phase == _PHASE_START:
+            phase = _PHASE_UP
+    return phase, down_run, up_run, rep_delta
+
+
+@njit(cache=True)
+def _fsm_step_keypoints(landmarks, smoothed, triplets, confidence_threshold,
+                        phase, down_run, up_run, down_limit, up_limit, sign,
+                        stability_frames):
+    """
+    Fused frame step: joint angle (mean over triplets) + _fsm_step.
+    
+    Returns:
+        (angle, new_phase, down_run, up_run, rep_delta); angle is NaN and the
+        FSM state is returned untouched when a keypoint is not visible.
+    """
+    angle = mean_triplet_angle(landmarks, smoothed, triplets, confidence_threshold)
+    if angle != angle:
+        return angle, phase, down_run, up_run, 0
+    phase, down_run, up_run, rep_delta = _fsm_step(
+        angle, phase, down_run, up_run, down_limit, up_limit, sign, stability_frames
+    )
+    return angle, phase, down_run, up_run, rep_delta
+
+
+@njit(cache=True)
+def _fsm_run(angles, phase, down_run, up_run, down_limit, up_limit, sign, stability_frames):
+    """
+    Runs _fsm_step over a whole angle series in one compiled loop.
+    
+    Returns:
+        (rep_deltas_cumsum, phases, final_phase, final_down_run, final_up_run)
+    """
+    n = angles.shape[0]
+    reps = np.empty(n, dtype=np.int64)
+    phases = np.empty(n, dtype=np.int64)
+    total = 0
+    for i in range(n):
+        phase, down_run, up_run, rep_delta = _fsm_step(
+            angles[i], phase, down_run, up_run,
+            down_limit, up_limit, sign, stability_frames
+        )
+        total += rep_delta
+        reps[i] = total
+        phases[i] = phase
+    return reps, phases, phase, down_run, up_run
+
+
 class RepetitionCounter:
     """
     Manages the logic of the state machine to count repetitions.
     Incorporates debouncing to avoid false counts due to jitter.
     
-    Thread-safe: Uses lock for history access to support potential async processing.
+    Thread-safe: Uses lock for state access to support potential async processing.
     """
     
     def __init__(
@@ -47,13 +141,23 @@ class RepetitionCounter:
         self.inverted = inverted  # If True: Up = SMALL angle, Down = LARGE angle
         self.stability_frames = stability_frames
         
-        # Internal state uses enum for type safety
-        self._phase = self._parse_phase(start_stage)
+        # Hysteresis limits in signed-angle space (see _fsm_step):
+        # standard: DOWN below down+tol, UP above up-tol
+        # inverted: DOWN above down-tol, UP below up+tol
+        self._sign = -1.0 if inverted else 1.0
+        self._down_limit = float(self._sign * down_threshold + HYSTERESIS_TOLERANCE)
+        self._up_limit = float(self._sign * up_threshold - HYSTERESIS_TOLERANCE)
+        
+        # Internal state is an integer phase code (see _CODE_TO_PHASE);
+        # the prefixed label of every phase is formatted once, here
+        self._phase_code = _PHASE_TO_CODE[self._parse_phase(start_stage)]
+        self._state_labels = tuple(self._prefixed(phase.value) for phase in _CODE_TO_PHASE)
         self.reps = 0
         
-        # Thread-safe history buffer
+        # Debounce counters (consecutive frames in DOWN / UP zone)
         self._lock = threading.RLock()
-        self._history: deque = deque(maxlen=5)
+        self._down_run = 0
+        self._up_run = 0
         self._logger = logging.getLogger(f"FSM.Rep.{state_prefix or 'generic'}")
     
     def _parse_phase(self, state_str: str) -> RepPhase:
@@ -63,10 +167,15 @@ class RepetitionCounter:
         except ValueError:
             return RepPhase.UNKNOWN
     
+    @property
+    def _phase(self) -> RepPhase:
+        """Current phase as enum (for logging and type-safe comparisons)."""
+        return _CODE_TO_PHASE[self._phase_code]
+    
     @property
     def state(self) -> str:
         """Returns prefixed state string for backward compatibility."""
-        return self._prefixed(self._phase.value)
+        return self._state_labels[self._phase_code]
     
     def _prefixed(self, state: str) -> str:
         """Returns prefixed state name, e.g., 'squat_up' from 'up'."""
@@ -74,78 +183,114 @@ class RepetitionCounter:
             return f"{self.state_prefix}_{state}"
         return state
 
-    def _transition(self, new_phase: RepPhase, angle: float) -> None:
+    def _transition(self, new_code: int, angle: float) -> None:
         """Applies a phase transition with structured logging."""
-        old_phase = self._phase
-        if old_phase != new_phase:
-            self._phase = new_phase
+        old_code = self._phase_code
+        if old_code != new_code:
+            self._phase_code = new_code
             self._logger.debug(
                 "%s -> %s | angle=%.1f | reps=%d",
-                old_phase.value, new_phase.value, angle, self.reps
+                _CODE_TO_PHASE[old_code].value, _CODE_TO_PHASE[new_code].value,
+                angle, self.reps
             )
 
     def process(self, angle: float) -> Tuple[int, str]:
         """
         Analyzes the new angle and updates the state and reps.
         
+        Standard logic (Squat, PushUp): DOWN when the angle goes below the
+        down threshold, UP (and count) when it goes above the up threshold.
+        Inverted logic (Bicep Curl): DOWN on extension (large angle),
+        UP (and count) on flexion (small angle).
+        
         Returns:
             Tuple of (reps_count, state_string)
         """
         with self._lock:
-            self._history.append(angle)
+            phase, self._down_run, self._up_run, rep_delta = _fsm_step(
+                float(angle), self._phase_code,
+                self._down_run, self._up_run,
+                self._down_limit, self._up_limit, self._sign,
+                self.stability_frames
+            )
+            self.reps += rep_delta
+            self._transition(phase, angle)
+            return self.reps, self._state_labels[phase]
+
+    def process_keypoints(
+        self,
+        landmarks: np.ndarray,
+        smoothed: np.ndarray,
+        triplets: np.ndarray,
+        confidence_threshold: float
+    ) -> Optional[Tuple[float, int, str]]:
+        """
+        Measures the joint angle from keypoints and processes it, in one
+        compiled call (see geometry.mean_triplet_angle for the angle).
         
-            if not self.inverted:
-                # --- STANDARD LOGIC (Squat, PushUp) ---
-                # DOWN: Angle decreases (goes below threshold)
-                # UP: Angle increases (goes above threshold)
-                
-                # DOWN TRANSITION
-                if angle < self.down_threshold + HYSTERESIS_TOLERANCE:
-                    if self._is_stable(lambda a: a < self.down_threshold + HYSTERESIS_TOLERANCE):
-                        self._transition(RepPhase.DOWN, angle)
-                        
-                # UP TRANSITION & COUNT
-                elif angle > self.up_threshold - HYSTERESIS_TOLERANCE:
-                    if self._is_stable(lambda a: a > self.up_threshold - HYSTERESIS_TOLERANCE):
-                        if self._phase == RepPhase.DOWN:
-                            self.reps += 1
-                            self._transition(RepPhase.UP, angle)
-                        elif self._phase == RepPhase.START:
-                            self._transition(RepPhase.UP, angle)
+        Args:
+            landmarks: Original landmarks with confidence values
+            smoothed: Smoothed landmarks for coordinates
+            triplets: (S, 3) int array, one (idx1, vertex, idx3) row per side
+            confidence_threshold: Minimum confidence required
             
-            else:
-                # --- INVERTED LOGIC (Bicep Curl) ---
-                # DOWN (Extension): Angle INCREASES (extends arm > 160)
-                # UP (Flexion/Contraction): Angle DECREASES (< 30)
-                
-                # DOWN TRANSITION
-                if angle > self.down_threshold - HYSTERESIS_TOLERANCE:
-                    if self._is_stable(lambda a: a > self.down_threshold - HYSTERESIS_TOLERANCE):
-                        self._transition(RepPhase.DOWN, angle)
-                
-                # UP TRANSITION & COUNT
-                elif angle < self.up_threshold + HYSTERESIS_TOLERANCE:
-                    if self._is_stable(lambda a: a < self.up_threshold + HYSTERESIS_TOLERANCE):
-                        if self._phase == RepPhase.DOWN:
-                            self.reps += 1
-                            self._transition(RepPhase.UP, angle)
-                        elif self._phase == RepPhase.START:
-                            self._transition(RepPhase.UP, angle)
-                
-            return self.reps, self.state
-
-    def _is_stable(self, predicate: Callable[[float], bool]) -> bool:
-        """Checks if a condition is true for 'stability_frames' consecutive frames."""
-        if len(self._history) < self.stability_frames:
-            return False
-        return all(predicate(x) for x in list(self._history)[-self.stability_frames:])
+        Returns:
+            Tuple of (angle, reps_count, state_string), or None (FSM untouched)
+            if any keypoint is not visible
+        """
+        with self._lock:
+            angle, phase, self._down_run, self._up_run, rep_delta = _fsm_step_keypoints(
+                landmarks, smoothed, triplets, confidence_threshold,
+                self._phase_code, self._down_run, self._up_run,
+                self._down_limit, self._up_limit, self._sign,
+                self.stability_frames
+            )
+            if angle != angle:  # NaN: not visible
+                return None
+            self.reps += rep_delta
+            self._transition(phase, angle)
+            return angle, self.reps, self._state_labels[phase]
+
+    def process_batch(self, angles: np.ndarray) -> Tuple[np.ndarray, List[str]]:
+        """
+        Runs process() over a whole angle series (e.g. an offline video).
+        
+        Equivalent to calling process() once per angle, but the FSM loop
+        runs in a single compiled pass.
+        
+        Returns:
+            Tuple of (reps per frame as int array, state string per frame)
+        """
+        angles = np.ascontiguousarray(angles, dtype=np.float64).reshape(-1)
+        if angles.size == 0:
+            return np.empty(0, dtype=np.int64), []
+        
+        with self._lock:
+            reps, phases, phase, self._down_run, self._up_run = _fsm_run(
+                angles, self._phase_code,
+                self._down_run, self._up_run,
+                self._down_limit, self._up_limit, self._sign,
+                self.stability_frames
+            )
+            reps += self.reps
+            self.reps = int(reps[-1])
+            self._transition(phase, float(angles[-1]))
+            
+            labels = self._state_labels
+            return reps, [labels[code] for code in phases]
     
     def reset(self) -> None:
         """Reset counter state."""
         self.reps = 0
-        self._phase = RepPhase.START
+        self._phase_code = _PHASE_START
         with self._lock:
-            self._history.clear()
+            self._down_run = 0
+            self._up_run = 0
+
+
+def _to_ms(seconds: float) -> int:
+    """Seconds -> integer milliseconds (rounded, so 0.57 s is 570 ms, not 569)."""
+    return int(round(seconds * 1000))
 
 
 class HoldPhase(Enum):
@@ -172,6 +317,9 @@ class StaticDurationCounter:
     - FINISHED: Form broke during active hold (or exercise complete)
     
     Thread-safe: Uses lock for state access to support potential async processing.
+    
+    Timestamps are converted once to integer milliseconds, so all duration
+    comparisons and second counts are exact integer arithmetic.
     """
     
     def __init__(self, stability_duration: float = 3.0):
@@ -179,16 +327,25 @@ class StaticDurationCounter:
         self._phase = HoldPhase.WAITING
         self.elapsed_seconds: int = 0
         
-        # Internal timestamps
-        self._hold_start: Optional[float] = None
-        self._active_start: Optional[float] = None
-        self._elapsed_raw: float = 0.0
+        # Internal timestamps (integer milliseconds)
+        self._hold_start_ms: Optional[int] = None
+        self._active_start_ms: Optional[int] = None
+        self._elapsed_ms: int = 0
         self._countdown_remaining: int = 0
         
         # Thread-safe
         self._lock = threading.RLock()
         self._logger = logging.getLogger("FSM.Hold")
 
+    @property
+    def stability_duration(self) -> float:
+        """Seconds of valid form required before the timer starts."""
+        return self._stability_ms / 1000
+
+    @stability_duration.setter
+    def stability_duration(self, seconds: float) -> None:
+        self._stability_ms = _to_ms(seconds)
+
     @property
     def state(self) -> str:
         """Returns the current state string."""
@@ -222,37 +379,38 @@ class StaticDurationCounter:
         Returns:
             Tuple of (elapsed_seconds, state_string)
         """
+        now_ms = _to_ms(timestamp)
         with self._lock:
             if self._phase == HoldPhase.WAITING:
                 if is_valid:
                     self._transition(HoldPhase.COUNTDOWN, t=f"{timestamp:.2f}")
-                    self._hold_start = timestamp
+                    self._hold_start_ms = now_ms
                     
             elif self._phase == HoldPhase.COUNTDOWN:
                 if is_valid:
-                    hold_time = timestamp - self._hold_start
-                    if hold_time >= self.stability_duration:
-                        self._transition(HoldPhase.ACTIVE, held=f"{hold_time:.1f}s")
-                        self._active_start = timestamp
-                        self._elapsed_raw = 0.0
+                    hold_ms = now_ms - self._hold_start_ms
+                    if hold_ms >= self._stability_ms:
+                        self._transition(HoldPhase.ACTIVE, held=f"{hold_ms / 1000:.1f}s")
+                        self._active_start_ms = now_ms
+                        self._elapsed_ms = 0
                     else:
-                        self._countdown_remaining = int(self.stability_duration - hold_time) + 1
+                        self._countdown_remaining = (self._stability_ms - hold_ms) // 1000 + 1
                 else:
                     # Form broke during countdown → reset
                     self._transition(HoldPhase.WAITING, reason="form_broke")
-                    self._hold_start = None
+                    self._hold_start_ms = None
                     self._countdown_remaining = 0
                     
             elif self._phase == HoldPhase.ACTIVE:
                 if is_valid:
-                    self._elapsed_raw = timestamp - self._active_start
+                    self._elapsed_ms = now_ms - self._active_start_ms
                 else:
                     # Form broke during active hold → finished
-                    self._transition(HoldPhase.FINISHED, elapsed=f"{self._elapsed_raw:.1f}s")
+                    self._transition(HoldPhase.FINISHED, elapsed=f"{self._elapsed_ms / 1000:.1f}s")
                     
             # FINISHED: no-op (stays finished until reset)
             
-            self.elapsed_seconds = int(self._elapsed_raw)
+            self.elapsed_seconds = self._elapsed_ms // 1000
             return self.elapsed_seconds, self.state
 
     def reset(self) -> None:
@@ -260,7 +418,7 @@ class StaticDurationCounter:
         with self._lock:
             self._phase = HoldPhase.WAITING
             self.elapsed_seconds = 0
-            self._hold_start = None
-            self._active_start = None
-            self._elapsed_raw = 0.0
+            self._hold_start_ms = None
+            self._active_start_ms = None
+            self._elapsed_ms = 0
             self._countdown_remaining = 0
@@ -8,7 +8,6 @@ Detects simple gestures for hands-free control:
 """
 import numpy as np
 from typing import Optional, Dict, Any
-from collections import deque
 from config.settings import GESTURE_Y_DIFF_THRESHOLD
 
 
@@ -31,19 +30,38 @@ class GestureDetector:
     LEFT_WRIST = 9
     RIGHT_WRIST = 10
     
+    # Gesture ids stored in the stability ring (0 = no gesture)
+    GESTURES = (None, "THUMBS_UP")
+    _GESTURE_IDS = {gesture: gesture_id for gesture_id, gesture in enumerate(GESTURES)}
+    
     def __init__(self, stability_frames: int = 10, confidence_threshold: float = 0.6) -> None:
         """
         Initialize gesture detector.
         
         Args:
             stability_frames: Number of consecutive frames gesture must be detected
+                (0 keeps no history, so no gesture is ever reported)
             confidence_threshold: Minimum keypoint confidence required
         """
         self.stability_frames = stability_frames
         self.confidence_threshold = confidence_threshold
         
-        # Gesture history for temporal stability
-        self.gesture_history: deque = deque(maxlen=stability_frames)
+        # Gesture history for temporal stability: a ring of gesture ids
+        # plus running per-id vote counts, so no per-frame recount
+        self._ring = [0] * stability_frames
+        self._votes = [0] * len(self.GESTURES)
+        self._pos = 0
+        self._filled = 0
+        self._min_votes = stability_frames * 0.5  # 50% threshold (was 70%)
+    
+    @property
+    def gesture_history(self) -> tuple:
+        """Recent per-frame gestures (None = no gesture), oldest first."""
+        if self._filled < self.stability_frames:
+            ids = self._ring[:self._filled]
+        else:
+            ids = self._ring[self._pos:] + self._ring[:self._pos]
+        return tuple(self.GESTURES[gesture_id] for gesture_id in ids)
     
     def detect(self, keypoints: np.ndarray) -> Optional[str]:
         """
@@ -56,13 +74,13 @@ class GestureDetector:
             Gesture name ("THUMBS_UP", "WAVE") or None if no gesture detected
         """
         if keypoints is None or len(keypoints) < 17:
-            self.gesture_history.append(None)
+            self._record(None)
             return None
         
         # Check for raised arm gesture (thumbs up approximation)
         gesture = self._detect_raised_arm(keypoints)
         
-        self.gesture_history.append(gesture)
+        self._record(gesture)
         
         # Return gesture only if stable for N frames
         return self._get_stable_gesture()
@@ -101,31 +119,39 @@ class GestureDetector:
         
         return None
     
+    def _record(self, gesture: Optional[str]) -> None:
+        """Pushes a frame's gesture into the ring, evicting the oldest vote."""
+        if not self.stability_frames:
+            return
+        gesture_id = self._GESTURE_IDS[gesture]
+        pos = self._pos
+        if self._filled == self.stability_frames:
+            self._votes[self._ring[pos]] -= 1
+        else:
+            self._filled += 1
+        self._ring[pos] = gesture_id
+        self._votes[gesture_id] += 1
+        self._pos = (pos + 1) % self.stability_frames
+    
     def _get_stable_gesture(self) -> Optional[str]:
         """
         Returns gesture only if detected consistently.
         
         Requires same gesture for majority of recent frames.
         """
-        if len(self.gesture_history) < self.stability_frames:
+        if not self.stability_frames or self._filled < self.stability_frames:
             return None
         
-        # Count occurrences
-        gestures = [g for g in self.gesture_history if g is not None]
-        
-        if len(gestures) < self.stability_frames * 0.5:  # 50% threshold (was 70%)
-            return None
-        
-        # Return most common gesture
-        from collections import Counter
-        counts = Counter(gestures)
-        most_common = counts.most_common(1)
-        
-        if most_common and most_common[0][1] >= self.stability_frames * 0.5:
-            return most_common[0][0]
+        # Most voted gesture (id 0 = no gesture is not a candidate)
+        best_id = max(range(1, len(self._votes)), key=self._votes.__getitem__)
+        if self._votes[best_id] >= self._min_votes:
+            return self.GESTURES[best_id]
         
         return None
     
     def reset(self) -> None:
         """Clear gesture history."""
-        self.gesture_history.clear()
+        self._ring = [0] * self.stability_frames
+        self._votes = [0] * len(self.GESTURES)
+        self._pos = 0
+        self._filled = 0
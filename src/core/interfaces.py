@@ -1,9 +1,10 @@
+import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Tuple, NamedTuple, Optional, Dict, Any
+from typing import Any, Dict, Tuple, NamedTuple, Optional, Sequence
 from collections import deque
 import numpy as np
-from src.utils.geometry import calculate_angle
+from src.utils.smoothing import BatchOneEuroFilter
 from src.core.config_types import ExerciseConfig
 
 
@@ -25,6 +26,10 @@ class PushUpHistoryEntry(NamedTuple):
 # Definition of the contract for the analysis results
 @dataclass
 class AnalysisResult:
+    # Built once per frame: __slots__ skips the per-instance __dict__
+    # (spelled out because dataclass(slots=True) needs Python 3.10+)
+    __slots__ = ("reps", "stage", "correction", "angle", "is_valid")
+
     reps: int
     stage: str  # "up", "down", "start"
     correction: str  # Feedback e.g. "Keep back straight!"
@@ -44,6 +49,10 @@ class Exercise(ABC):
     Abstract Base Class (Interface).
     Each new exercise (Squat, Curl, PushUp) MUST inherit from this class
     and implement these methods.
+
+    Keypoint smoothing: call set_smoothed_keypoints(indices, ...) in __init__.
+    The old contract of filling self.smoothers ({index: PointSmoother}) is
+    deprecated; smooth_landmarks() still applies those filters but warns.
     """
 
 
@@ -54,7 +63,10 @@ class Exercise(ABC):
         self.stage = "start"
         # Circular buffer for recent history analysis (e.g., last 30 frames ~ 1 sec)
         self.history = deque(maxlen=30)
-        # Dictionary of keypoint filters (Idx -> PointSmoother)
+        # Batched keypoint filter over smoothed_indices (see set_smoothed_keypoints)
+        self.smoothed_indices: np.ndarray = np.empty(0, dtype=np.intp)
+        self.smoother: Optional[BatchOneEuroFilter] = None
+        # Deprecated per-keypoint smoothers, superseded by set_smoothed_keypoints
         self.smoothers: Dict[int, Any] = {}
         
         # Localization key for exercise display name (OCP)
@@ -62,54 +74,80 @@ class Exercise(ABC):
         # Canonical exercise name for database storage
         self.exercise_id: str = ""
 
+    def set_smoothed_keypoints(
+        self,
+        indices: Sequence[int],
+        min_cutoff: float = 1.0,
+        beta: float = 0.0,
+        d_cutoff: float = 1.0
+    ) -> None:
+        """
+        Registers the keypoints to filter in smooth_landmarks.
+        All of them share a single BatchOneEuroFilter.
+        """
+        self.smoothed_indices = np.asarray(indices, dtype=np.intp)
+        self.smoother = BatchOneEuroFilter(len(self.smoothed_indices), min_cutoff, beta, d_cutoff)
+
     def smooth_landmarks(self, landmarks: np.ndarray, timestamp: Optional[float] = None) -> np.ndarray:
         """
-        Applies smoothing to keypoints registered in self.smoothers.
+        Applies smoothing to the keypoints registered via set_smoothed_keypoints.
         Returns a copy of the landmarks with filtered (x,y) coordinates.
         """
         smoothed = landmarks.copy()
-        
-        for idx, smoother in self.smoothers.items():
-            try:
-                raw_pt = (landmarks[idx][0], landmarks[idx][1])
-                smooth_pt = smoother(raw_pt, t=timestamp)
-                smoothed[idx][0] = smooth_pt[0]
-                smoothed[idx][1] = smooth_pt[1]
-            except IndexError:
-                # Smoother index out of range - skip this keypoint
-                continue
-                
+
+        if self.smoothers:
+            self._apply_legacy_smoothers(landmarks, smoothed, timestamp)
+
+        idx = self.smoothed_indices
+        if self.smoother is None or idx.size == 0:
+            return smoothed
+
+        # Malformed input missing some keypoints: smooth the ones present
+        if len(landmarks) <= idx.max():
+            self._smooth_present_keypoints(landmarks, smoothed, timestamp)
+            return smoothed
+
+        smoothed[idx, :2] = self.smoother(landmarks[idx, :2], t=timestamp)
         return smoothed
 
-    def _calculate_side_angle(
+    def _smooth_present_keypoints(
         self,
         landmarks: np.ndarray,
         smoothed: np.ndarray,
-        indices: tuple,
-        confidence_threshold: float
-    ) -> float:
+        timestamp: Optional[float]
+    ) -> None:
         """
-        Calculates angle for a set of 3 keypoints if confidence is sufficient.
-        
-        Args:
-            landmarks: Original landmarks with confidence values
-            smoothed: Smoothed landmarks for coordinates
-            indices: Tuple of (idx1, idx2, idx3) where idx2 is the vertex
-            confidence_threshold: Minimum confidence required
-            
-        Returns:
-            Calculated angle in degrees, or None if confidence too low
+        Filters the registered keypoints that exist in a short landmarks array.
+        Missing keypoints are fed their last estimate, so they hold still.
+        Before the filter has any state the present ones pass through raw.
         """
-        idx1, idx2, idx3 = indices
-        
-        # Check if all keypoints have sufficient confidence
-        if min(landmarks[idx1][2], landmarks[idx2][2], landmarks[idx3][2]) >= confidence_threshold:
-            return calculate_angle(
-                smoothed[idx1][:2],
-                smoothed[idx2][:2],
-                smoothed[idx3][:2]
-            )
-        return None
+        if self.smoother.x_prev is None:
+            return
+
+        present = self.smoothed_indices < len(landmarks)
+        points = self.smoother.x_prev.copy()
+        points[present] = landmarks[self.smoothed_indices[present], :2]
+        filtered = self.smoother(points, t=timestamp)
+        smoothed[self.smoothed_indices[present], :2] = filtered[present]
+
+    def _apply_legacy_smoothers(
+        self,
+        landmarks: np.ndarray,
+        smoothed: np.ndarray,
+        timestamp: Optional[float]
+    ) -> None:
+        """Filters the keypoints registered in the deprecated self.smoothers dict."""
+        warnings.warn(
+            f"{type(self).__name__}.smoothers is deprecated; register keypoints "
+            "with set_smoothed_keypoints() instead",
+            DeprecationWarning,
+            stacklevel=3
+        )
+        for idx, smoother in self.smoothers.items():
+            if idx >= len(landmarks):
+                # Smoother index out of range - skip this keypoint
+                continue
+            smoothed[idx, :2] = smoother((landmarks[idx, 0], landmarks[idx, 1]), t=timestamp)
 
     def get_state_display(self, state: str) -> StateDisplayInfo:
         """
@@ -141,8 +179,10 @@ class Exercise(ABC):
         self.reps = 0
         self.stage = "start"
         self.history.clear()
-        for s in self.smoothers.values():
-            s.reset()
+        if self.smoother is not None:
+            self.smoother.reset()
+        for legacy_smoother in self.smoothers.values():
+            legacy_smoother.reset()
 
 class VideoSource(ABC):
     """
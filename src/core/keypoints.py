@@ -0,0 +1,47 @@
+"""
+Structure-of-arrays keypoint storage for multi-frame analysis.
+
+Live processing works on one YOLO (17, 3) array per frame. Offline
+analysis (recorded sessions, test sweeps) handles many frames at once;
+storing each coordinate joint-major makes every per-joint slice a
+contiguous row, so angle series vectorize across all frames in one call.
+"""
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from src.utils.geometry import calculate_angles_xy
+
+
+class KeypointBatch(NamedTuple):
+    """
+    N frames of 17 keypoints, one (17, N) float32 array per channel.
+    
+    xs[j] / ys[j] / confs[j] hold joint j across all frames.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    confs: np.ndarray
+
+    @classmethod
+    def from_array(cls, keypoints: np.ndarray) -> "KeypointBatch":
+        """Builds a batch from YOLO layout: (17, 3) or (N, 17, 3)."""
+        keypoints = np.asarray(keypoints, dtype=np.float32)
+        if keypoints.ndim == 2:
+            keypoints = keypoints[np.newaxis]
+        # (N, 17, 3) -> (3, 17, N): one contiguous copy, then split channels
+        channels = np.ascontiguousarray(keypoints.transpose(2, 1, 0))
+        return cls(channels[0], channels[1], channels[2])
+
+    @property
+    def n_frames(self) -> int:
+        return self.xs.shape[1]
+
+    def joint_angles(self, a: int, b: int, c: int) -> np.ndarray:
+        """Angle at joint b (between a and c) for every frame, shape (N,)."""
+        xs, ys = self.xs, self.ys
+        return calculate_angles_xy(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+
+    def visible(self, indices: Sequence[int], threshold: float) -> np.ndarray:
+        """Per-frame mask: True where every joint in indices reaches threshold."""
+        return (self.confs[list(indices)] >= threshold).all(axis=0)
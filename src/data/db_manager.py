@@ -8,13 +8,15 @@ from src.core.entities.session import Session
 from config.settings import DB_PATH
 
 class DatabaseManager:
-    def __init__(self, db_path: str = DB_PATH, schema_path: str = "src/data/schema.sql"):
+    def __init__(self, db_path: str = DB_PATH, schema_path: str = "src/data/schema.sql", timeout: float = 5.0):
         self.db_path = db_path
         self.schema_path = schema_path
+        # Seconds to wait on a locked database before raising OperationalError
+        self.timeout = timeout
         self._init_db()
 
     def _get_connection(self):
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -5,7 +5,10 @@ When this package is imported, all exercise modules are loaded,
 triggering their @register_exercise decorators.
 
 To add a new exercise:
-1. Create the exercise file (e.g., lunges.py)
+1. Create the exercise file (e.g., lunges.py). A rep exercise measured on
+   one joint angle per side should subclass TripletRepExercise (_rep.py),
+   like curl.py and squat.py: it only declares SIDE_INDICES, the FSM and
+   the feedback rules.
 2. Add @register_exercise("lunges") decorator to the class
 3. Import it here
 4. Done! The factory will automatically see it.
@@ -0,0 +1,114 @@
+"""
+Shared base for rep exercises driven by a single joint angle.
+
+Curl and Squat only differ in their keypoint triplets, FSM thresholds
+and feedback rules: the per-frame pipeline (smoothing -> fused angle +
+FSM step -> feedback -> history) lives here once.
+"""
+
+import numpy as np
+from typing import Optional
+from src.core.interfaces import Exercise, AnalysisResult, HistoryEntry
+from src.core.mixins import RepBasedMixin
+from src.core.config_types import ExerciseConfig
+from src.core.fsm import RepetitionCounter
+from src.core.feedback import FeedbackSystem
+from config.settings import CONFIDENCE_THRESHOLD, SMOOTHING_MIN_CUTOFF, SMOOTHING_BETA
+
+
+class TripletRepExercise(RepBasedMixin, Exercise):
+    """
+    Rep-based exercise measured on one (A, B, C) keypoint triplet per side.
+
+    Subclasses provide:
+    - SIDE_INDICES: {"left": (a, b, c), "right": (a, b, c)}
+    - PERFECT_FORM_KEY: message shown instead of the generic "feedback_perfect"
+    - self.fsm / self.feedback, built after calling super().__init__()
+    """
+
+    SIDES = ("left", "right", "both")
+    SIDE_INDICES: dict = {}
+    PERFECT_FORM_KEY: str = "feedback_perfect"
+
+    def __init__(self, config: ExerciseConfig):
+        super().__init__(config)
+
+        # Body side to analyze: 'right' (default), 'left' or 'both'
+        self.side = config.get("side", "right")
+        if self.side not in self.SIDES:
+            raise ValueError(
+                f"Invalid side {self.side!r} for {type(self).__name__}; "
+                f"expected one of {', '.join(map(repr, self.SIDES))}"
+            )
+        # One triplet row per analyzed side ("both" -> left and right)
+        self._side_triplets = np.array(
+            [self.SIDE_INDICES[side] for side in self._get_sides_to_process()], dtype=np.intp
+        )
+
+        # Smoother for the triplets of both sides
+        self.set_smoothed_keypoints(
+            self.SIDE_INDICES["left"] + self.SIDE_INDICES["right"],
+            min_cutoff=config.get("smoothing_min_cutoff", SMOOTHING_MIN_CUTOFF),
+            beta=config.get("smoothing_beta", SMOOTHING_BETA)
+        )
+
+        self.fsm: Optional[RepetitionCounter] = None
+        self.feedback = FeedbackSystem()
+
+    def process_frame(self, landmarks: np.ndarray, timestamp: Optional[float] = None) -> AnalysisResult:
+        """
+        Input: landmarks (Array 17x3 of YOLO: [x, y, conf])
+        Output: AnalysisResult
+        """
+
+        # --- 1. Smoothing ---
+        smoothed_landmarks = self.smooth_landmarks(landmarks, timestamp)
+
+        # --- 2. Side Processing + FSM Rep Counting (one fused compiled step) ---
+        measurement = self.fsm.process_keypoints(
+            landmarks, smoothed_landmarks,
+            self._side_triplets, CONFIDENCE_THRESHOLD
+        )
+
+        # If we don't have valid angles
+        if measurement is None:
+            return AnalysisResult(
+                reps=self.reps,
+                stage="unknown",
+                correction="err_body_not_visible",
+                angle=0.0,
+                is_valid=False
+            )
+
+        # --- 3. Delegate to Subsystems ---
+
+        # A. FSM Rep Counting (already stepped above; prefixed state)
+        angle, self.reps, self.stage = measurement
+
+        # B. Feedback System
+        feedback_ctx = {"angle": angle, "stage": self.stage}
+        correction_feedback, is_valid = self.feedback.check(feedback_ctx)
+
+        if correction_feedback == "feedback_perfect":
+            correction_feedback = self.PERFECT_FORM_KEY
+
+        # Update History (using NamedTuple for memory efficiency)
+        self.history.append(HistoryEntry(
+            angle=angle,
+            stage=self.stage,
+            reps=self.reps,
+            is_valid=is_valid
+        ))
+
+        return AnalysisResult(
+            reps=self.reps,
+            stage=self.stage,
+            correction=correction_feedback,
+            angle=angle,
+            is_valid=is_valid
+        )
+
+    def reset(self):
+        super().reset()
+        self.fsm.reset()
+        self.feedback.reset()
@@ -1,3 +1,4 @@
+import math
 import time
 import numpy as np
 from typing import Optional
@@ -5,13 +6,18 @@ from src.core.interfaces import Exercise, AnalysisResult, HistoryEntry, StateDis
 from src.core.config_types import ExerciseConfig
 from src.core.registry import register_exercise
 from src.core.fsm import StaticDurationCounter
-from src.utils.geometry import calculate_angle
-from src.utils.smoothing import PointSmoother
+from src.utils.geometry import mean_triplet_angle
 from src.core.feedback import FeedbackSystem
 from config.settings import PLANK_THRESHOLDS, CONFIDENCE_THRESHOLD, SMOOTHING_MIN_CUTOFF, SMOOTHING_BETA
 
 @register_exercise("plank")
 class Plank(Exercise):
+    # Keypoint indices: (Shoulder, Elbow, Wrist, Hip, Ankle) for each side
+    SIDE_INDICES = {
+        "left": (5, 7, 9, 11, 15),   # L Shoulder, L Elbow, L Wrist, L Hip, L Ankle
+        "right": (6, 8, 10, 12, 16)  # R Shoulder, R Elbow, R Wrist, R Hip, R Ankle
+    }
+
     def __init__(self, config: ExerciseConfig):
         super().__init__(config)
         self.display_name_key = "plank_name"
@@ -24,32 +30,33 @@ class Plank(Exercise):
         )
         self.stage = "waiting"
         
+        # Form thresholds, resolved once instead of per frame
+        self._body_min = float(PLANK_THRESHOLDS["SHOULDER_HIP_ANKLE_MIN"])
+        self._elbow_min = float(PLANK_THRESHOLDS["ELBOW_ANGLE_MIN"])
+        self._elbow_max = float(PLANK_THRESHOLDS["ELBOW_ANGLE_MAX"])
+        
         self.side = "left" # Default to left view for plank usually, but can be configured
         if config.get("side"):
              self.side = config.get("side")
 
+        # Single-row triplets for the analyzed side (unknown sides fall back to left)
+        shoulder, elbow, wrist, hip, ankle = self.SIDE_INDICES.get(self.side, self.SIDE_INDICES["left"])
+        self._body_triplet = np.array([(shoulder, hip, ankle)], dtype=np.intp)
+        self._elbow_triplet = np.array([(shoulder, elbow, wrist)], dtype=np.intp)
+
         # Smoothers
-        self.smoothers = {
-             # Left side
-            5: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Shoulder
-            7: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Elbow
-            9: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Wrist
-            11: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),# L Hip
-            15: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Ankle
-            
-            # Right side
-            6: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Shoulder
-            8: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Elbow
-            10: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Wrist
-            12: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Hip
-            16: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA)  # R Ankle
-        }
+        self.set_smoothed_keypoints(
+            (5, 7, 9, 11, 15,   # L Shoulder, Elbow, Wrist, Hip, Ankle
+             6, 8, 10, 12, 16), # R Shoulder, Elbow, Wrist, Hip, Ankle
+            min_cutoff=config.get("smoothing_min_cutoff", SMOOTHING_MIN_CUTOFF),
+            beta=config.get("smoothing_beta", SMOOTHING_BETA)
+        )
         
         self.feedback = FeedbackSystem()
         
         # Rule: Body Straightness (Shoulder-Hip-Ankle)
         self.feedback.add_rule(
-            condition=lambda ctx: ctx.get("body_angle", 180) < PLANK_THRESHOLDS["SHOULDER_HIP_ANKLE_MIN"],
+            condition=lambda ctx: ctx.get("body_angle", 180) < self._body_min,
             message_key="plank_err_hips", # e.g. "Keep hips in line!"
             priority=10
         )
@@ -66,36 +73,24 @@ class Plank(Exercise):
 
     def process_frame(self, landmarks: np.ndarray, timestamp: Optional[float] = None) -> AnalysisResult:
         if timestamp is None:
-            timestamp = time.time()
+            timestamp = time.monotonic()
             
         smoothed_landmarks = self.smooth_landmarks(landmarks, timestamp)
         
-        # Keypoints
-        side_indices = {
-            "left": {
-                "shoulder": 5, "elbow": 7, "wrist": 9, "hip": 11, "ankle": 15
-            },
-            "right": {
-                "shoulder": 6, "elbow": 8, "wrist": 10, "hip": 12, "ankle": 16
-            }
-        }
-        
-        indices = side_indices.get(self.side, side_indices["left"])
-        
-        # Calculate Angles
+        # Calculate Angles (NaN when a keypoint is below confidence)
         # 1. Body Angle (Shoulder - Hip - Ankle) -> Should be ~180
-        body_angle = self._calculate_side_angle(
-            landmarks, smoothed_landmarks, 
-            (indices["shoulder"], indices["hip"], indices["ankle"]), 
-            CONFIDENCE_THRESHOLD
+        body_angle = mean_triplet_angle(
+            landmarks, smoothed_landmarks, self._body_triplet, CONFIDENCE_THRESHOLD
         )
         
         # 2. Elbow Angle (Shoulder - Elbow - Wrist) -> Should be ~90
-        elbow_angle = self._calculate_side_angle(
-             landmarks, smoothed_landmarks,
-             (indices["shoulder"], indices["elbow"], indices["wrist"]),
-             CONFIDENCE_THRESHOLD
+        elbow_angle = mean_triplet_angle(
+            landmarks, smoothed_landmarks, self._elbow_triplet, CONFIDENCE_THRESHOLD
         )
+        if math.isnan(body_angle):
+            body_angle = None
+        if math.isnan(elbow_angle):
+            elbow_angle = None
         
         is_valid_pose = (body_angle is not None and elbow_angle is not None)
         
@@ -103,8 +98,8 @@ class Plank(Exercise):
         
         if is_valid_pose:
             # Check thresholds
-            body_ok = body_angle >= PLANK_THRESHOLDS["SHOULDER_HIP_ANKLE_MIN"]
-            elbow_ok = (PLANK_THRESHOLDS["ELBOW_ANGLE_MIN"] <= elbow_angle <= PLANK_THRESHOLDS["ELBOW_ANGLE_MAX"])
+            body_ok = body_angle >= self._body_min
+            elbow_ok = (self._elbow_min <= elbow_angle <= self._elbow_max)
             is_form_correct = body_ok and elbow_ok
 
         # Delegate state machine to StaticDurationCounter
@@ -1,11 +1,10 @@
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 from src.core.interfaces import Exercise, AnalysisResult, PushUpHistoryEntry, StateDisplayInfo
 from src.core.mixins import RepBasedMixin
 from src.core.config_types import ExerciseConfig
 from src.core.registry import register_exercise
 from src.utils.geometry import calculate_angle
-from src.utils.smoothing import PointSmoother
 from src.core.fsm import RepetitionCounter
 from src.core.feedback import FeedbackSystem
 from config.settings import PUSHUP_THRESHOLDS, CONFIDENCE_THRESHOLD, SMOOTHING_MIN_CUTOFF, SMOOTHING_BETA
@@ -13,6 +12,10 @@ from config.settings import PUSHUP_THRESHOLDS, CONFIDENCE_THRESHOLD, SMOOTHING_M
 
 @register_exercise("pushup")
 class PushUp(RepBasedMixin, Exercise):
+    # Keypoint indices per side: (Shoulder, Elbow, Wrist, Hip, Ankle)
+    LEFT_INDICES = (5, 7, 9, 11, 15)
+    RIGHT_INDICES = (6, 8, 10, 12, 16)
+
     def __init__(self, config: ExerciseConfig):
         super().__init__(config)
         
@@ -22,23 +25,18 @@ class PushUp(RepBasedMixin, Exercise):
         # Side to analyze: 'left', 'right', or 'auto' (based on confidence/visibility)
         # Defaulting to 'left' as usually one side is presented to camera
         self.side = config.get("side", "left")
+        # Sides are resolved once here, not per frame
+        sides = self._get_sides_to_process()
+        self._use_left = "left" in sides
+        self._use_right = "right" in sides
 
         # Configure smoothers for key joints
-        self.smoothers = {
-            # Left Side
-            5: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),  # L Shoulder
-            7: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),  # L Elbow
-            9: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),  # L Wrist
-            11: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Hip
-            15: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # L Ankle
-            
-            # Right Side
-            6: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),  # R Shoulder
-            8: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA),  # R Elbow
-            10: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Wrist
-            12: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA), # R Hip
-            16: PointSmoother(min_cutoff=SMOOTHING_MIN_CUTOFF, beta=SMOOTHING_BETA)  # R Ankle
-        }
+        self.set_smoothed_keypoints(
+            (5, 7, 9, 11, 15,   # L Shoulder, Elbow, Wrist, Hip, Ankle
+             6, 8, 10, 12, 16), # R Shoulder, Elbow, Wrist, Hip, Ankle
+            min_cutoff=config.get("smoothing_min_cutoff", SMOOTHING_MIN_CUTOFF),
+            beta=config.get("smoothing_beta", SMOOTHING_BETA)
+        )
 
         # --- FSM & Feedback (with defaults from settings) ---
         self.fsm = RepetitionCounter(
@@ -66,6 +64,31 @@ class PushUp(RepBasedMixin, Exercise):
         }
         return _map.get(state, super().get_state_display(state))
 
+    def _side_data(
+        self,
+        landmarks: np.ndarray,
+        smoothed: np.ndarray,
+        indices: Tuple[int, int, int, int, int]
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Elbow angle, body angle and mean confidence for one side,
+        or None unless all of its keypoints are visible.
+        """
+        idx_shoulder, idx_elbow, idx_wrist, idx_hip, idx_ankle = indices
+        confidences = landmarks[list(indices), 2]
+        if not (confidences >= CONFIDENCE_THRESHOLD).all():
+            return None
+
+        angle_elbow = calculate_angle(smoothed[idx_shoulder][:2],
+                                      smoothed[idx_elbow][:2],
+                                      smoothed[idx_wrist][:2])
+
+        angle_body = calculate_angle(smoothed[idx_shoulder][:2],
+                                     smoothed[idx_hip][:2],
+                                     smoothed[idx_ankle][:2])
+
+        return angle_elbow, angle_body, confidences.mean()
+
     def process_frame(self, landmarks: np.ndarray, timestamp: Optional[float] = None) -> AnalysisResult:
         """
         Input: landmarks (Array 17x3 from YOLO: [x, y, conf])
@@ -75,53 +98,17 @@ class PushUp(RepBasedMixin, Exercise):
         # --- 1. Smoothing & Keypoint Selection ---
         smoothed_landmarks = self.smooth_landmarks(landmarks, timestamp)
 
-        # Indices map
-        idx_shoulder_l, idx_elbow_l, idx_wrist_l = 5, 7, 9
-        idx_hip_l, idx_ankle_l = 11, 15
-        
-        idx_shoulder_r, idx_elbow_r, idx_wrist_r = 6, 8, 10
-        idx_hip_r, idx_ankle_r = 12, 16
-        
-        # Determine target sides (using base class helper)
-        sides_to_process = self._get_sides_to_process()
-            
         # Data holders per side
         data_left = None  # Will hold (angle_reps, angle_form, confidence)
         data_right = None
 
         # --- Process Left ---
-        if "left" in sides_to_process:
-             required_indices = [idx_shoulder_l, idx_elbow_l, idx_wrist_l, idx_hip_l, idx_ankle_l]
-             # Check if all points are visible
-             if all(landmarks[i][2] >= CONFIDENCE_THRESHOLD for i in required_indices):
-                # Calculate average confidence for this side
-                conf_l = np.mean([landmarks[i][2] for i in required_indices])
-                
-                angle_l_elbow = calculate_angle(smoothed_landmarks[idx_shoulder_l][:2], 
-                                                smoothed_landmarks[idx_elbow_l][:2], 
-                                                smoothed_landmarks[idx_wrist_l][:2])
-                
-                angle_l_body = calculate_angle(smoothed_landmarks[idx_shoulder_l][:2], 
-                                               smoothed_landmarks[idx_hip_l][:2], 
-                                               smoothed_landmarks[idx_ankle_l][:2])
-                
-                data_left = (angle_l_elbow, angle_l_body, conf_l)
+        if self._use_left:
+            data_left = self._side_data(landmarks, smoothed_landmarks, self.LEFT_INDICES)
 
         # --- Process Right ---
-        if "right" in sides_to_process:
-             required_indices = [idx_shoulder_r, idx_elbow_r, idx_wrist_r, idx_hip_r, idx_ankle_r]
-             if all(landmarks[i][2] >= CONFIDENCE_THRESHOLD for i in required_indices):
-                conf_r = np.mean([landmarks[i][2] for i in required_indices])
-                
-                angle_r_elbow = calculate_angle(smoothed_landmarks[idx_shoulder_r][:2], 
-                                                smoothed_landmarks[idx_elbow_r][:2], 
-                                                smoothed_landmarks[idx_wrist_r][:2])
-                
-                angle_r_body = calculate_angle(smoothed_landmarks[idx_shoulder_r][:2], 
-                                               smoothed_landmarks[idx_hip_r][:2], 
-                                               smoothed_landmarks[idx_ankle_r][:2])
-                
-                data_right = (angle_r_elbow, angle_r_body, conf_r)
+        if self._use_right:
+            data_right = self._side_data(landmarks, smoothed_landmarks, self.RIGHT_INDICES)
 
         # --- Selection Logic (Winner Takes All) ---
         current_angle = 0.0
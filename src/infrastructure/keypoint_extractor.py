@@ -32,18 +32,15 @@ class YoloKeypointExtractor:
         if not pose_data:
             return False, None
             
-        # Guard: No keypoints attribute
-        if not hasattr(pose_data[0], 'keypoints'):
-            return False, None
-            
-        # Guard: Keypoints is None
-        if pose_data[0].keypoints is None:
+        # Guard: No keypoints attribute / Keypoints is None
+        keypoints = getattr(pose_data[0], 'keypoints', None)
+        if keypoints is None:
             return False, None
             
         # Guard: No detected persons
-        if pose_data[0].keypoints.data.shape[0] == 0:
+        data = keypoints.data
+        if data.shape[0] == 0:
             return False, None
         
         # Extract keypoints for first person (17x3 array)
-        keypoints = pose_data[0].keypoints.data[0].cpu().numpy()
-        return True, keypoints
+        return True, data[0].cpu().numpy()
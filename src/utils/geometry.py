@@ -1,6 +1,11 @@
 import math
 from typing import Tuple
 
+import numpy as np
+
+from src.utils.jit import njit
+
+
 def calculate_angle(a: Tuple[float, float], 
                     b: Tuple[float, float], 
                     c: Tuple[float, float]) -> float:
@@ -16,11 +21,17 @@ def calculate_angle(a: Tuple[float, float],
     Returns:
         float: Angle in degrees (0-180)
     """
-    # Extract coordinates for clarity and speed (avoids NumPy overhead)
-    ax, ay = a[0], a[1]
-    bx, by = b[0], b[1]
-    cx, cy = c[0], c[1]
-    
+    return _angle_core(float(a[0]), float(a[1]),
+                       float(b[0]), float(b[1]),
+                       float(c[0]), float(c[1]))
+
+
+@njit("float64(float64, float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def _angle_core(ax: float, ay: float,
+                bx: float, by: float,
+                cx: float, cy: float) -> float:
+    """Scalar angle kernel (compiled by Numba when available)."""
     # Calculate vectors BA and BC
     # Vector BA = A - B
     ba_x = ax - bx
@@ -30,24 +41,86 @@ def calculate_angle(a: Tuple[float, float],
     bc_x = cx - bx
     bc_y = cy - by
     
-    # Dot Product
-    dot_product = (ba_x * bc_x) + (ba_y * bc_y)
+    # Difference of the two directions (no sqrt/divide/clamp/acos chain)
+    angle = abs(math.degrees(math.atan2(bc_y, bc_x) - math.atan2(ba_y, ba_x)))
     
-    # Magnitude of vectors
-    mag_ba = math.sqrt(ba_x**2 + ba_y**2)
-    mag_bc = math.sqrt(bc_x**2 + bc_y**2)
+    # Fold the reflex side back into 0-180 (min lowers to a select, not a jump)
+    angle = min(angle, 360.0 - angle)
+    
+    # Degenerate angle: a point coincides with the vertex.
+    # Non-short-circuit '&'/'|' keep this a single select at the return.
+    degenerate = ((ba_x == 0.0) & (ba_y == 0.0)) | ((bc_x == 0.0) & (bc_y == 0.0))
+    return 0.0 if degenerate else angle
+
+
+@njit(cache=True)
+def mean_triplet_angle(landmarks: np.ndarray, smoothed: np.ndarray,
+                       triplets: np.ndarray, confidence_threshold: float) -> float:
+    """
+    Mean angle over several (a, vertex, c) keypoint triplets in one compiled pass.
+    
+    Args:
+        landmarks: (17, 3) keypoints whose confidences gate the result
+        smoothed: (17, 3) keypoints whose coordinates are measured
+        triplets: (S, 3) integer keypoint indices, one row per side
+        confidence_threshold: Minimum confidence for every keypoint used
+        
+    Returns:
+        float: Mean angle in degrees, or NaN if any keypoint is missing
+            or below the confidence threshold
+    """
+    n_points = min(landmarks.shape[0], smoothed.shape[0])
+    n_sides = triplets.shape[0]
+    total = 0.0
+    for s in range(n_sides):
+        i = triplets[s, 0]
+        j = triplets[s, 1]
+        k = triplets[s, 2]
+        if max(i, j, k) >= n_points:
+            return math.nan
+        if min(landmarks[i, 2], landmarks[j, 2], landmarks[k, 2]) < confidence_threshold:
+            return math.nan
+        total += _angle_core(float(smoothed[i, 0]), float(smoothed[i, 1]),
+                             float(smoothed[j, 0]), float(smoothed[j, 1]),
+                             float(smoothed[k, 0]), float(smoothed[k, 1]))
+    return total / n_sides
+
+
+def calculate_angles(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_angle over N triplets.
     
-    # Avoid division by zero
-    if mag_ba * mag_bc == 0:
-        return 0.0
+    Args:
+        a, b, c: Arrays of shape (N, 2) (or (2,) for a single point);
+            b holds the vertices.
         
-    # Calculate cosine
-    cosine_angle = dot_product / (mag_ba * mag_bc)
+    Returns:
+        np.ndarray: Angles in degrees (0-180), shape (N,)
+    """
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 2)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 2)
+    c = np.asarray(c, dtype=np.float64).reshape(-1, 2)
+    return calculate_angles_xy(a[:, 0], a[:, 1], b[:, 0], b[:, 1], c[:, 0], c[:, 1])
+
+
+def calculate_angles_xy(ax: np.ndarray, ay: np.ndarray,
+                        bx: np.ndarray, by: np.ndarray,
+                        cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    """
+    Structure-of-arrays form of calculate_angles: one array per coordinate.
     
-    # Handle numeric errors (clamp between -1.0 and 1.0)
-    cosine_angle = max(-1.0, min(1.0, cosine_angle))
+    Returns:
+        np.ndarray: Angles in degrees (0-180), same shape as the inputs
+    """
+    ba_x = ax - bx
+    ba_y = ay - by
+    bc_x = cx - bx
+    bc_y = cy - by
     
-    # Calculate angle in radians and convert to degrees
-    angle = math.degrees(math.acos(cosine_angle))
+    angles = np.abs(np.degrees(np.arctan2(bc_y, bc_x) - np.arctan2(ba_y, ba_x)))
+    angles = np.where(angles > 180.0, 360.0 - angles, angles)
     
-    return round(angle, 2)
\ No newline at end of file
+    # Degenerate angle: a point coincides with the vertex
+    degenerate = ((ba_x == 0) & (ba_y == 0)) | ((bc_x == 0) & (bc_y == 0))
+    angles[degenerate] = 0.0
+    return angles
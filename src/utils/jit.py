@@ -0,0 +1,28 @@
+"""
+Optional Numba JIT support.
+
+Numba is not a hard dependency: when it is not installed, `njit` degrades
+to a no-op decorator and the decorated kernels run as plain Python.
+"""
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _numba_njit = None
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """
+    Drop-in replacement for `numba.njit`.
+
+    Supports both the bare `@njit` form and `@njit(signature, cache=True, ...)`.
+    """
+    if NUMBA_AVAILABLE:
+        return _numba_njit(*args, **kwargs)
+
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -2,16 +2,16 @@
 Performance utilities for monitoring and optimization.
 """
 import time
-from collections import deque
 from typing import Optional
 
 
 class FPSCounter:
     """
-    Rolling average FPS calculator.
+    Smoothed FPS calculator.
     
-    Uses a sliding window of timestamps to calculate smooth FPS
-    without sudden spikes or drops.
+    Keeps an exponential moving average (EMA) of the frame time, which
+    behaves like a rolling average over ~window_size frames without
+    storing per-frame timestamps.
     """
     
     def __init__(self, window_size: int = 30) -> None:
@@ -19,9 +19,11 @@ class FPSCounter:
         Initialize FPS counter.
         
         Args:
-            window_size: Number of frames to average over (default 30 = ~1 sec at 30fps)
+            window_size: Equivalent number of frames to average over (default 30 = ~1 sec at 30fps)
         """
-        self.times: deque = deque(maxlen=window_size)
+        self.alpha = 2.0 / (window_size + 1)
+        self._last_t: Optional[float] = None
+        self._ema_dt: float = 0.0
     
     def tick(self) -> float:
         """
@@ -30,33 +32,46 @@ class FPSCounter:
         Call this once per frame in the main loop.
         
         Returns:
-            float: Current FPS (rolling average)
+            float: Current FPS (moving average)
         """
         now = time.perf_counter()
-        self.times.append(now)
-        
-        if len(self.times) < 2:
+        if self._last_t is None:
+            self._last_t = now
             return 0.0
         
-        # FPS = frames / time_elapsed
-        elapsed = self.times[-1] - self.times[0]
-        if elapsed <= 0:
-            return 0.0
-            
-        return (len(self.times) - 1) / elapsed
+        dt = now - self._last_t
+        self._last_t = now
+        
+        if self._ema_dt > 0:
+            self._ema_dt = self.alpha * dt + (1 - self.alpha) * self._ema_dt
+        else:
+            self._ema_dt = dt
+        
+        return self.get_fps()
     
     def reset(self) -> None:
-        """Clear all recorded timestamps."""
-        self.times.clear()
+        """Clear the recorded timing state."""
+        self._last_t = None
+        self._ema_dt = 0.0
+    
+    def get_fps(self) -> float:
+        """
+        Get the current FPS without recording a new timestamp.
+        
+        Returns:
+            float: Current FPS (moving average), 0.0 before two ticks
+        """
+        if self._ema_dt <= 0:
+            return 0.0
+        return 1.0 / self._ema_dt
     
     def get_frame_time_ms(self) -> float:
         """
         Get average frame time in milliseconds.
         
+        Does not record a new timestamp; call tick() once per frame.
+        
         Returns:
             float: Average ms per frame
         """
-        fps = self.tick()
-        if fps <= 0:
-            return 0.0
-        return 1000.0 / fps
+        return self._ema_dt * 1000.0
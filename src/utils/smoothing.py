@@ -1,8 +1,36 @@
 import math
 import time
 
+import numpy as np
+
 from typing import Tuple, Optional
 
+from src.utils.jit import njit
+
+
+@njit("UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def _one_euro_step(x: float, x_prev: float, dx_prev: float, dt: float,
+                   min_cutoff: float, beta: float, d_cutoff: float) -> Tuple[float, float]:
+    """Single One Euro update (dt > 0). Returns (x_hat, dx_hat)."""
+    # Compute the alpha for the derivative low pass filter
+    r_d = 2 * math.pi * d_cutoff * dt
+    a_d = r_d / (r_d + 1)
+    
+    # Estimate the derivative (speed of change)
+    dx = (x - x_prev) / dt
+    dx_hat = a_d * dx + (1 - a_d) * dx_prev
+
+    # Dynamic cutoff frequency based on speed
+    cutoff = min_cutoff + beta * abs(dx_hat)
+    r = 2 * math.pi * cutoff * dt
+    a = r / (r + 1)
+    
+    # Smooth the signal
+    x_hat = a * x + (1 - a) * x_prev
+    return x_hat, dx_hat
+
+
 class OneEuroFilter:
     def __init__(self, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0) -> None:
         """
@@ -23,7 +51,7 @@ class OneEuroFilter:
 
     def __call__(self, x: float, t: Optional[float] = None) -> float:
         if t is None:
-            t = time.time()
+            t = time.monotonic()
             
         if self.x_prev is None:
             self.x_prev = x
@@ -35,19 +63,10 @@ class OneEuroFilter:
         if dt <= 0:
             return self.x_prev  # Avoid division by zero and unordered time
 
-        # Compute the alpha for the low pass filter
-        a_d = self.smoothing_factor(dt, self.d_cutoff)
-        
-        # Estimate the derivative (speed of change)
-        dx = (x - self.x_prev) / dt
-        dx_hat = self.exponential_smoothing(a_d, dx, self.dx_prev)
-
-        # Dynamic cutoff frequency based on speed
-        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
-        a = self.smoothing_factor(dt, cutoff)
-        
-        # Smooth the signal
-        x_hat = self.exponential_smoothing(a, x, self.x_prev)
+        x_hat, dx_hat = _one_euro_step(
+            float(x), float(self.x_prev), float(self.dx_prev), dt,
+            self.min_cutoff, self.beta, self.d_cutoff
+        )
 
         # Update state
         self.x_prev = x_hat
@@ -56,18 +75,12 @@ class OneEuroFilter:
         
         return x_hat
 
-    def smoothing_factor(self, dt: float, cutoff: float) -> float:
-        r = 2 * math.pi * cutoff * dt
-        return r / (r + 1)
-
-    def exponential_smoothing(self, a: float, x: float, x_prev: float) -> float:
-        return a * x + (1 - a) * x_prev
-    
     def reset(self) -> None:
         self.x_prev = None
         self.dx_prev = None
         self.t_prev = None
 
+
 class PointSmoother:
     """Helper to smooth 2D points (x, y)."""
     def __init__(self, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0) -> None:
@@ -75,6 +88,8 @@ class PointSmoother:
         self.filter_y = OneEuroFilter(min_cutoff, beta, d_cutoff)
         
     def __call__(self, point: Tuple[float, float], t: Optional[float] = None) -> Tuple[float, float]:
+        if t is None:
+            t = time.monotonic()  # One clock read shared by both axes
         x, y = point
         sx = self.filter_x(x, t)
         sy = self.filter_y(y, t)
@@ -83,3 +98,71 @@ class PointSmoother:
     def reset(self) -> None:
         self.filter_x.reset()
         self.filter_y.reset()
+
+
+class BatchOneEuroFilter:
+    """
+    One Euro Filter applied to N 2D points at once.
+
+    Equivalent to N independent PointSmoothers sharing the same timestamps,
+    but the whole frame is filtered with a handful of vectorized NumPy ops
+    instead of 2*N Python-level filter calls.
+    """
+    def __init__(self, n_points: int, min_cutoff: float = 1.0, beta: float = 0.0, d_cutoff: float = 1.0) -> None:
+        self.n_points = n_points
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+
+        self.x_prev: Optional[np.ndarray] = None   # (n_points, 2)
+        self.dx_prev: Optional[np.ndarray] = None  # (n_points, 2)
+        self.t_prev: Optional[float] = None
+
+    def __call__(self, points: np.ndarray, t: Optional[float] = None) -> np.ndarray:
+        """
+        Args:
+            points: Array of shape (n_points, 2) with raw (x, y) coordinates.
+            t: Timestamp in seconds (defaults to time.monotonic()).
+
+        Returns:
+            np.ndarray: Smoothed (n_points, 2) array. float32 input (as emitted
+            by the pose model) stays float32; anything else is filtered in float64.
+        """
+        if t is None:
+            t = time.monotonic()
+
+        x = np.asarray(points)
+        if x.dtype != np.float32:
+            x = np.asarray(x, dtype=np.float64)
+
+        if self.x_prev is None:
+            self.x_prev = x.copy()
+            self.dx_prev = np.zeros_like(self.x_prev)
+            self.t_prev = t
+            return self.x_prev.copy()
+
+        dt = t - self.t_prev
+        if dt <= 0:
+            return self.x_prev.copy()  # Avoid division by zero and unordered time
+
+        # Derivative estimate, low-pass filtered at d_cutoff
+        r_d = 2 * math.pi * self.d_cutoff * dt
+        a_d = r_d / (r_d + 1)
+        dx = (x - self.x_prev) / dt
+        dx_hat = a_d * dx + (1 - a_d) * self.dx_prev
+
+        # Per-coordinate dynamic cutoff based on speed
+        r = (2 * math.pi * dt) * (self.min_cutoff + self.beta * np.abs(dx_hat))
+        a = r / (r + 1)
+        x_hat = a * x + (1 - a) * self.x_prev
+
+        self.x_prev = x_hat
+        self.dx_prev = dx_hat
+        self.t_prev = t
+
+        return x_hat
+
+    def reset(self) -> None:
+        self.x_prev = None
+        self.dx_prev = None
+        self.t_prev = None
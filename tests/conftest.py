@@ -1,8 +1,14 @@
 import sys
-import os
 from pathlib import Path
 
 # Add project root to sys.path so that src modules can be imported
 # This assumes conftest.py is in the tests/ directory
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow_no_jit: slow when NUMBA_DISABLE_JIT=1; deselect with -m 'not slow_no_jit'"
+    )
@@ -24,6 +24,12 @@ class UIState:
     state_display: Optional[Any] = None
 
 
+# Shared read-only 640x480 black frame for tests that only need a frame's
+# shape (e.g. mocks that pass frames through without drawing on them).
+BLANK_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+BLANK_FRAME.setflags(write=False)
+
+
 def create_dummy_frame(width: int = 640, height: int = 480) -> np.ndarray:
     """
     Creates a dummy BGR frame (3-channel numpy array) for testing.
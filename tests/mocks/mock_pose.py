@@ -6,6 +6,7 @@ Enables:
 - Unit testing without GPU requirements
 - Predictable pose data for reproducible tests
 """
+import itertools
 import numpy as np
 from typing import Any, List, Optional
 
@@ -33,7 +34,7 @@ class MockPoseEstimator:
         """
         self.pose_data = pose_data if pose_data is not None else [None]
         self.loop = loop
-        self.index = 0
+        self.reset()
     
     def predict(self, frame: np.ndarray) -> Any:
         """
@@ -45,16 +46,8 @@ class MockPoseEstimator:
         Returns:
             Pre-defined pose result, or None when exhausted.
         """
-        if self.index >= len(self.pose_data):
-            if self.loop:
-                self.index = 0
-            else:
-                return None
-        
-        result = self.pose_data[self.index]
-        self.index += 1
-        return result
+        return next(self._poses, None)
     
     def reset(self) -> None:
-        """Resets the pose data index to the beginning."""
-        self.index = 0
+        """Restarts the pose sequence from the beginning."""
+        self._poses = itertools.cycle(self.pose_data) if self.loop else iter(self.pose_data)
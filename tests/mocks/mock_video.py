@@ -6,6 +6,7 @@ Enables:
 - Unit testing of SpotterApp game loop
 - Predictable frame sequences for reproducible tests
 """
+import itertools
 import numpy as np
 from typing import Tuple, List, Optional
 from src.core.interfaces import VideoSource
@@ -32,7 +33,9 @@ class MockVideoSource(VideoSource):
         """
         self.frames = frames if frames is not None else [self._blank_frame()]
         self.loop = loop
-        self.index = 0
+        # Shared result returned once exhausted (avoids a new array per call)
+        self._exhausted = (False, np.empty((0,), dtype=np.uint8))
+        self.reset()
         
     def _blank_frame(self) -> np.ndarray:
         """Creates a default 640x480 black frame."""
@@ -45,14 +48,9 @@ class MockVideoSource(VideoSource):
         Returns:
             Tuple of (success, frame). Returns (False, empty) when exhausted.
         """
-        if self.index >= len(self.frames):
-            if self.loop:
-                self.index = 0
-            else:
-                return False, np.array([])
-        
-        frame = self.frames[self.index]
-        self.index += 1
+        frame = next(self._frames, None)
+        if frame is None:
+            return self._exhausted
         return True, frame
     
     def release(self) -> None:
@@ -60,5 +58,5 @@ class MockVideoSource(VideoSource):
         pass
     
     def reset(self) -> None:
-        """Resets the frame index to the beginning."""
-        self.index = 0
+        """Restarts the frame sequence from the beginning."""
+        self._frames = itertools.cycle(self.frames) if self.loop else iter(self.frames)
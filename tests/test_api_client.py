@@ -7,17 +7,12 @@ async upload. All HTTP calls are mocked — no real network requests.
 Run with: python -m pytest tests/test_api_client.py -v
 """
 import json
-import sys
-import os
 import time
 import unittest
 from unittest.mock import patch, MagicMock, PropertyMock
 from datetime import datetime, timedelta
 from threading import Event
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.data.api_client import CloudSessionUploader
 from src.core.entities.session import Session
 
@@ -10,17 +10,12 @@ These tests verify that:
 Run with: python -m pytest tests/test_app_di.py -v
 """
 import unittest
-import sys
-import os
 import tempfile
-import numpy as np
-
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.app import SpotterApp
 from tests.mocks.mock_video import MockVideoSource
 from tests.mocks.mock_pose import MockPoseEstimator
+from tests.helpers import BLANK_FRAME
 from src.core.entities.user import User
 
 
@@ -51,12 +46,10 @@ class MockDatabaseManager:
 class TestSpotterAppDI(unittest.TestCase):
     """Test SpotterApp with Dependency Injection."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_video = MockVideoSource()
-        self.mock_pose = MockPoseEstimator()
-        self.mock_db = MockDatabaseManager()
-        self.test_config = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures that no test mutates (shared by the class)."""
+        cls.test_config = {
             'exercise_name': 'squat',
             'exercise_config': {'side': 'left'},
             'target_sets': 1,
@@ -64,6 +57,12 @@ class TestSpotterAppDI(unittest.TestCase):
             'language': 'EN'
         }
     
+    def setUp(self):
+        """Set up stateful mocks (fresh per test)."""
+        self.mock_video = MockVideoSource()
+        self.mock_pose = MockPoseEstimator()
+        self.mock_db = MockDatabaseManager()
+    
     def test_app_accepts_injected_dependencies(self):
         """Test that SpotterApp correctly accepts injected dependencies."""
         app = SpotterApp(
@@ -80,7 +79,7 @@ class TestSpotterAppDI(unittest.TestCase):
     
     def test_mock_video_source_returns_frames(self):
         """Test that MockVideoSource returns frames correctly."""
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        frames = [BLANK_FRAME] * 3
         mock = MockVideoSource(frames=frames)
         
         # Should return 3 frames
@@ -95,7 +94,7 @@ class TestSpotterAppDI(unittest.TestCase):
     
     def test_mock_video_source_loops(self):
         """Test that MockVideoSource loops correctly when enabled."""
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8)]
+        frames = [BLANK_FRAME]
         mock = MockVideoSource(frames=frames, loop=True)
         
         # Should loop indefinitely
@@ -109,14 +108,14 @@ class TestSpotterAppDI(unittest.TestCase):
         mock = MockPoseEstimator(pose_data=pose_data)
         
         # Should return 2 poses
-        result1 = mock.predict(np.zeros((480, 640, 3)))
+        result1 = mock.predict(BLANK_FRAME)
         self.assertEqual(result1["keypoints"], [1, 2, 3])
         
-        result2 = mock.predict(np.zeros((480, 640, 3)))
+        result2 = mock.predict(BLANK_FRAME)
         self.assertEqual(result2["keypoints"], [4, 5, 6])
         
         # Should be exhausted
-        result3 = mock.predict(np.zeros((480, 640, 3)))
+        result3 = mock.predict(BLANK_FRAME)
         self.assertIsNone(result3)
     
     def test_mock_db_manager_creates_default_user(self):
@@ -5,27 +5,25 @@ This test validates the main game loop including:
 - Frame acquisition from VideoSource
 - AI Inference (via mocked PoseEstimator)
 - Logic updates (SessionManager)
-- UI Rendering (Visualizer)
-- graceful exit on 'q' key or end of stream
+- Output (UIState JSON emitted to the OutputSink)
+- graceful exit on a 'quit' command
+
+Per-frame processing is tested directly through _process_one_frame();
+the full run() loop is exercised once as a single-frame smoke test.
 
 It mocks:
-- cv2.imshow (to run headless)
-- cv2.waitKey (to control loop execution)
+- OutputSink (records emitted frames instead of streaming them)
 - YOLO results (to avoid loading heavy models)
 """
 import unittest
-import sys
-import os
-import cv2
+import json
 import numpy as np
-from unittest.mock import MagicMock, patch
-
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.core.app import SpotterApp
+from src.core.interfaces import OutputSink
 from tests.mocks.mock_video import MockVideoSource
 from tests.mocks.mock_pose import MockPoseEstimator
+from tests.helpers import BLANK_FRAME
 from src.core.entities.user import User
 
 class MockDatabaseManager:
@@ -44,28 +42,53 @@ class MockDatabaseManager:
     def save_session(self, session):
         self.sessions.append(session)
 
+class RecordingOutputSink(OutputSink):
+    """OutputSink that records every emitted (frame, state_json) pair."""
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, frame, state_json):
+        self.emitted.append((frame, state_json))
+
+
+class _MockTensor:
+    """Stands in for a torch tensor: supports the .cpu().numpy() chain."""
+    def __init__(self, array):
+        self._array = array
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self._array
+
+
+class _MockKeypointData:
+    """Stands in for keypoints.data of shape (num_persons, 17, 3)."""
+    def __init__(self, array):
+        self._tensor = _MockTensor(array)
+        self.shape = (1,)  # at least one person
+
+    def __getitem__(self, index):
+        return self._tensor
+
+
+class _MockKeypoints:
+    def __init__(self, array):
+        self.data = _MockKeypointData(array)
+
+
 class MockYoloResult:
-    """Helper to mock YOLO results structure without PyTorch."""
+    """Helper to mock YOLO results structure without PyTorch (plain objects, no MagicMock)."""
     def __init__(self, keypoints_array):
-        self.keypoints = MagicMock()
-        # Mock data tensor
-        self.keypoints.data = MagicMock()
-        # Mock .cpu().numpy() chain
-        tensor_mock = MagicMock()
-        tensor_mock.cpu.return_value.numpy.return_value = keypoints_array
-        self.keypoints.data.__getitem__.return_value = tensor_mock
-        # Should also support shape access
-        self.keypoints.data.shape = [1] # at least one person
+        self.keypoints = _MockKeypoints(keypoints_array)
 
 class TestSpotterAppIntegration(unittest.TestCase):
     
-    def setUp(self):
-        # Mocks
-        self.mock_video = MockVideoSource()
-        self.mock_db = MockDatabaseManager()
-        
-        # Test Config
-        self.test_config = {
+    @classmethod
+    def setUpClass(cls):
+        # Test Config (read-only, shared by the class)
+        cls.test_config = {
             'exercise_name': 'squat',
             'exercise_config': {},
             'target_sets': 1,
@@ -73,74 +96,65 @@ class TestSpotterAppIntegration(unittest.TestCase):
             'language': 'EN'
         }
 
-    @patch('cv2.imshow')
-    @patch('cv2.waitKey')
-    def test_run_loop_execution(self, mock_wait_key, mock_imshow):
-        """
-        Critical Test: Verifies the main run() loop executes correctly.
-        """
-        # 1. Setup Input Data (3 frames)
-        frames = [np.zeros((480, 640, 3), dtype=np.uint8) for _ in range(3)]
-        self.mock_video = MockVideoSource(frames=frames, loop=False)
+    def setUp(self):
+        # Mocks (stateful, fresh per test)
+        self.mock_video = MockVideoSource()
+        self.mock_db = MockDatabaseManager()
 
-        # 2. Setup Pose Data (Mock YOLO structure)
-        # Create a fake keypoint array (17 keypoints, 3 values [x, y, conf])
-        # YoloKeypointExtractor does data[0], so we simulate that this inner tensor 
-        # resolves to a (17, 3) array.
-        fake_keypoints = np.zeros((17, 3), dtype=np.float32)
-        
-        # Mock PoseEstimator returning a list containing one result object
-        # The app expects predict() to return something the specific KeypointExtractor can parse.
-        # Since we use YoloKeypointExtractor in App.setup(), we must provide Yolo-like objects.
-        mock_yolo_result = MockYoloResult(fake_keypoints)
-        pose_data_seq = [[mock_yolo_result], [mock_yolo_result], [mock_yolo_result]]
-        
+    def _create_app(self, frames, pose_data_seq):
+        self.mock_video = MockVideoSource(frames=frames, loop=False)
         self.mock_pose = MockPoseEstimator(pose_data=pose_data_seq)
-
-        # 3. Create App
+        self.sink = RecordingOutputSink()
         app = SpotterApp(
             video_source=self.mock_video,
             pose_detector=self.mock_pose,
             db_manager=self.mock_db,
-            config=self.test_config
+            config=self.test_config,
+            output_sink=self.sink
         )
-        
-        # 4. Initialize Components
         app.setup()
+        return app
+
+    def test_process_one_frame(self):
+        """
+        Verifies per-frame processing (logic update + output) in isolation,
+        without spinning the full run() loop.
+        """
+        # YoloKeypointExtractor does data[0].cpu().numpy(), so the mock result
+        # resolves to a (17, 3) keypoint array.
+        fake_keypoints = np.zeros((17, 3), dtype=np.float32)
+        pose_data = [MockYoloResult(fake_keypoints)]
+        app = self._create_app([BLANK_FRAME], [])
+
+        for _ in range(3):
+            app._process_one_frame(BLANK_FRAME, pose_data)
+
+        # One emit per processed frame, each with a serialized UIState
+        self.assertEqual(len(self.sink.emitted), 3)
+        frame, state_json = self.sink.emitted[-1]
+        self.assertIs(frame, BLANK_FRAME)
+        state = json.loads(state_json)
+        self.assertEqual(state["target_reps"], 5)
+        self.assertEqual(state["language"], "EN")
+
+    def test_run_loop_execution(self):
+        """
+        Smoke test: the real run() loop processes a frame and exits cleanly
+        on a 'quit' command.
+        """
+        fake_keypoints = np.zeros((17, 3), dtype=np.float32)
+        app = self._create_app([BLANK_FRAME], [[MockYoloResult(fake_keypoints)]])
         
-        # 5. Run App
-        # We need to ensure the loop terminates.
-        # Method 1: MockVideoSource returns False after frames are exhausted.
-        # Method 2: waitKey returns 'q' at some point.
-        
-        # Mock waitKey to return 'q' (ord('q') = 113) after 3 calls to exit the loop
-        # or return -1 (no key) otherwise.
-        # Actually, if video source runs out, the loop continues? 
-        # Let's check App.run logic:
-        # ret, frame = video_source.get_frame()
-        # if not ret: continue
-        
-        # Ah, if ret is False, it just logs and continues! Infinite loop risk.
-        # We must interrupt via 'q' key or by mocking self.running in a side effect.
-        
-        # Let's use side_effect on waitKey to simulate user pressing 'q' after typical updates
-        # ord('q') == 113
-        mock_wait_key.side_effect = [-1, -1, 113] # 2 frames processed, then Quit
-        
+        # Queued before run(): handled right after the first frame
+        app.command_queue.put('quit')
         app.run()
         
-        # 6. Verify Interations
-        
-        # Check that imshow was called (meaning render pipeline worked)
-        self.assertTrue(mock_imshow.called, "cv2.imshow should be called")
-        self.assertEqual(mock_imshow.call_count, 3) # Once per loop iteration
-        
-        # Check that logic updated
-        # We can check internal state of session manager
+        self.assertEqual(len(self.sink.emitted), 1)
         self.assertIsNotNone(app.session_manager)
         
-        # Verify clean shutdown
+        # Verify clean shutdown (session persisted in _cleanup)
         self.assertFalse(app.running)
+        self.assertEqual(len(self.mock_db.sessions), 1)
 
 if __name__ == '__main__':
     unittest.main()
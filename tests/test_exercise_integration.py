@@ -9,68 +9,97 @@ make STRONG assertions: assertEqual(reps, 1), assertFalse(is_valid), etc.
 
 Key design notes:
 - Timestamps are passed explicitly so the OneEuroFilter smoother converges
-  quickly between states (without timestamps, the smoother uses time.time()
+  quickly between states (without timestamps, the smoother uses time.monotonic()
   which can produce tiny deltas in fast test loops).
-- 10 frames per state phase ensures both smoother convergence AND FSM
-  stability requirements (FSM_STABILITY_FRAMES=2).
+- Rep-counting tests use _PASSTHROUGH_SMOOTHING (very high min_cutoff) so the
+  filter follows the raw pose almost immediately; 3 frames per phase then
+  covers the FSM stability requirement (FSM_STABILITY_FRAMES=2).
+- One test per exercise family keeps the production smoothing settings with
+  _REALISTIC_FRAMES_PER_PHASE frames to cover filter convergence.
+- The module is marked slow_no_jit: with NUMBA_DISABLE_JIT=1 the whole
+  pipeline falls back to pure Python; deselect it with -m 'not slow_no_jit'.
 """
 import unittest
 import numpy as np
+import pytest
 
 from src.exercises.curl import BicepCurl
 from src.exercises.squat import Squat
 from src.exercises.pushup import PushUp
 from src.exercises.plank import Plank
 
+pytestmark = pytest.mark.slow_no_jit
+
 # Frame timing: 30 FPS simulation
 _DT = 1.0 / 30
-_FRAMES_PER_PHASE = 10  # Enough for smoother + FSM stability
+_FRAMES_PER_PHASE = 3  # FSM stability (2 frames) + 1, with pass-through smoothing
+_REALISTIC_FRAMES_PER_PHASE = 10  # Enough for default smoother + FSM stability
+
+# Smoothing config that makes the OneEuroFilter follow raw keypoints almost exactly
+_PASSTHROUGH_SMOOTHING = {"smoothing_min_cutoff": 1000.0, "smoothing_beta": 0.0}
 
 
 # ---------------------------------------------------------------------------
 # Keypoint Helpers
 # ---------------------------------------------------------------------------
 
-def _curl_keypoints(elbow_angle: float, confidence: float = 0.9) -> np.ndarray:
+# Pre-zeroed template: unused joints must stay 0 (not np.empty garbage)
+# because the exercise smoothers read every registered joint.
+# float32, like the keypoints the pose model emits.
+_ZERO_KEYPOINTS = np.zeros((17, 3), dtype=np.float32)
+
+
+def _curl_keypoints_batch(elbow_angles, confidence: float = 0.9) -> np.ndarray:
     """
-    Create right-arm curl keypoints producing a specific elbow angle.
+    Create right-arm curl keypoints for several elbow angles at once.
     
-    Vertex is at the elbow (index 8). The angle is measured between
-    shoulder→elbow and wrist→elbow vectors.
+    Returns shape (len(elbow_angles), 17, 3). Vertex is at the elbow
+    (index 8); the angle is measured between shoulder→elbow and
+    wrist→elbow vectors.
     """
-    kp = np.zeros((17, 3))
+    # The shoulder is straight up, so offset from the downward direction
+    rads = np.radians(180 - np.asarray(elbow_angles, dtype=float))
+    batch = np.broadcast_to(_ZERO_KEYPOINTS, (len(rads), 17, 3)).copy()
 
-    shoulder = np.array([300.0, 200.0])
-    elbow = np.array([300.0, 300.0])  # Straight down
+    batch[:, 6] = (300.0, 200.0, confidence)                # R Shoulder
+    batch[:, 8] = (300.0, 300.0, confidence)                # R Elbow
+    batch[:, 10, 0] = 300.0 + 100 * np.sin(rads)            # R Wrist
+    batch[:, 10, 1] = 300.0 + 100 * np.cos(rads)
+    batch[:, 10, 2] = confidence
+    return batch
 
-    # Calculate wrist position to get desired angle at elbow
-    rad = np.radians(elbow_angle)
-    wrist = elbow + np.array([100 * np.sin(rad), 100 * np.cos(rad)])
 
-    kp[6] = [shoulder[0], shoulder[1], confidence]  # R Shoulder
-    kp[8] = [elbow[0], elbow[1], confidence]        # R Elbow
-    kp[10] = [wrist[0], wrist[1], confidence]       # R Wrist
-    return kp
+def _curl_keypoints(elbow_angle: float, confidence: float = 0.9) -> np.ndarray:
+    """Single-pose variant of _curl_keypoints_batch."""
+    return _curl_keypoints_batch((elbow_angle,), confidence)[0]
 
 
-def _squat_keypoints(knee_angle: float, confidence: float = 0.9) -> np.ndarray:
+def _squat_keypoints_batch(knee_angles, confidence: float = 0.9) -> np.ndarray:
     """
-    Create right-leg squat keypoints producing a specific knee angle.
+    Create right-leg squat keypoints for several knee angles at once.
     
-    Vertex is at the knee (index 14). Uses conversion to geometry angle.
+    Returns shape (len(knee_angles), 17, 3). Vertex is at the knee (index 14).
     """
-    kp = np.zeros((17, 3))
+    # Hip straight above the knee, so offset from the downward direction
+    rads = np.radians(180 - np.asarray(knee_angles, dtype=float))
+    batch = np.broadcast_to(_ZERO_KEYPOINTS, (len(rads), 17, 3)).copy()
 
-    hip = np.array([300.0, 200.0])
-    knee = np.array([300.0, 350.0])
+    batch[:, 12] = (300.0, 200.0, confidence)               # R Hip
+    batch[:, 14] = (300.0, 350.0, confidence)               # R Knee
+    batch[:, 16, 0] = 300.0 + 100 * np.sin(rads)            # R Ankle
+    batch[:, 16, 1] = 350.0 + 100 * np.cos(rads)
+    batch[:, 16, 2] = confidence
+    return batch
 
-    rad = np.radians(180 - knee_angle)
-    ankle = knee + np.array([100 * np.sin(rad), 100 * np.cos(rad)])
 
-    kp[12] = [hip[0], hip[1], confidence]      # R Hip
-    kp[14] = [knee[0], knee[1], confidence]     # R Knee
-    kp[16] = [ankle[0], ankle[1], confidence]   # R Ankle
-    return kp
+def _squat_keypoints(knee_angle: float, confidence: float = 0.9) -> np.ndarray:
+    """Single-pose variant of _squat_keypoints_batch."""
+    return _squat_keypoints_batch((knee_angle,), confidence)[0]
+
+
+# Left-side joints set by the pushup/plank helpers:
+# L Shoulder, L Elbow, L Wrist, L Hip, L Ankle
+_LEFT_BODY_JOINTS = np.array([5, 7, 9, 11, 15])
 
 
 def _pushup_keypoints(elbow_extended: bool = True,
@@ -83,30 +112,23 @@ def _pushup_keypoints(elbow_extended: bool = True,
     - Elbow angle: angle at index 7 between indices 5-7-9
     - Body angle:  angle at index 11 between indices 5-11-15
     """
-    kp = np.zeros((17, 3))
-
-    # Shoulder (constant)
-    kp[5] = [200, 200, confidence]  # L Shoulder
-
-    if elbow_extended:
-        # Extended: shoulder→elbow→wrist nearly straight (~170°)
-        kp[7] = [200, 300, confidence]  # L Elbow (straight down)
-        kp[9] = [200, 400, confidence]  # L Wrist (continues straight)
-    else:
-        # Bent: ~90° at elbow
-        kp[7] = [200, 300, confidence]  # L Elbow (straight down)
-        kp[9] = [300, 300, confidence]  # L Wrist (90° to the right)
-
-    # Hip (constant, horizontal from shoulder)
-    kp[11] = [400, 200, confidence]  # L Hip
-
-    if body_straight:
-        # Body straight: shoulder-hip-ankle collinear (~180°)
-        kp[15] = [600, 200, confidence]  # L Ankle (continues horizontal)
-    else:
-        # Body sagging: ~90° at hip
-        kp[15] = [400, 400, confidence]  # L Ankle (straight down from hip)
-
+    kp = _ZERO_KEYPOINTS.copy()
+
+    # Extended: shoulder→elbow→wrist nearly straight (~170°)
+    # Bent: wrist 90° to the right of the elbow
+    wrist = (200, 400) if elbow_extended else (300, 300)
+    # Body straight: shoulder-hip-ankle collinear (~180°)
+    # Body sagging: ankle straight down from hip (~90°)
+    ankle = (600, 200) if body_straight else (400, 400)
+
+    kp[_LEFT_BODY_JOINTS, :2] = (
+        (200, 200),  # L Shoulder
+        (200, 300),  # L Elbow (straight down)
+        wrist,       # L Wrist
+        (400, 200),  # L Hip (horizontal from shoulder)
+        ankle,       # L Ankle
+    )
+    kp[_LEFT_BODY_JOINTS, 2] = confidence
     return kp
 
 
@@ -119,23 +141,22 @@ def _plank_keypoints(body_straight: bool = True,
     body_straight=True  → ~180° body line (shoulder-hip-ankle)
     elbow_correct=True  → ~90°  elbow angle (shoulder-elbow-wrist)
     """
-    kp = np.zeros((17, 3))
-
-    kp[5] = [0, 0, confidence]      # L Shoulder
-    kp[11] = [1, 0, confidence]     # L Hip
-
-    if body_straight:
-        kp[15] = [2, 0, confidence]  # L Ankle → straight line ~180°
-    else:
-        kp[15] = [1, 1, confidence]  # L Ankle → bent ~90°
+    kp = _ZERO_KEYPOINTS.copy()
+
+    kp[_LEFT_BODY_JOINTS, :2] = (
+        (0, 0),                               # L Shoulder
+        (0, 1),                               # L Elbow → down
+        (1, 1) if elbow_correct else (0, 2),  # L Wrist → 90° / ~180° (arms extended)
+        (1, 0),                               # L Hip
+        (2, 0) if body_straight else (1, 1),  # L Ankle → straight ~180° / bent ~90°
+    )
+    kp[_LEFT_BODY_JOINTS, 2] = confidence
+    return kp
 
-    if elbow_correct:
-        kp[7] = [0, 1, confidence]   # L Elbow → down
-        kp[9] = [1, 1, confidence]   # L Wrist → 90° angle
-    else:
-        kp[7] = [0, 1, confidence]   # L Elbow
-        kp[9] = [0, 2, confidence]   # L Wrist → ~180° (arms extended)
 
+def _frozen(kp: np.ndarray) -> np.ndarray:
+    """Marks a shared keypoint fixture read-only so no test can mutate it."""
+    kp.flags.writeable = False
     return kp
 
 
@@ -159,13 +180,17 @@ def _feed_phase(exercise, keypoints, n: int, start_time: float):
 class TestCurlIntegration(unittest.TestCase):
     """End-to-end rep counting for BicepCurl."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loop-invariant poses, built once for the whole class
+        cls.extended, cls.flexed = map(_frozen, _curl_keypoints_batch((170, 25)))
+
     def setUp(self):
-        self.curl = BicepCurl({"side": "right"})
+        self.curl = BicepCurl({"side": "right", **_PASSTHROUGH_SMOOTHING})
 
     def test_full_rep_counted(self):
         """Extended→Flexed = 1 rep (inverted: small angle = UP = rep)."""
-        extended = _curl_keypoints(elbow_angle=170)
-        flexed = _curl_keypoints(elbow_angle=25)
+        extended, flexed = self.extended, self.flexed
 
         _, t = _feed_phase(self.curl, extended, _FRAMES_PER_PHASE, 0.0)
         result, _ = _feed_phase(self.curl, flexed, _FRAMES_PER_PHASE, t)
@@ -174,8 +199,7 @@ class TestCurlIntegration(unittest.TestCase):
 
     def test_two_reps_counted(self):
         """Two full down→up cycles = 2 reps."""
-        extended = _curl_keypoints(elbow_angle=170)
-        flexed = _curl_keypoints(elbow_angle=25)
+        extended, flexed = self.extended, self.flexed
 
         t = 0.0
         for _ in range(2):
@@ -184,13 +208,14 @@ class TestCurlIntegration(unittest.TestCase):
 
         self.assertEqual(self.curl.reps, 2)
 
-    def test_low_confidence_rejects(self):
-        """Keypoints below CONFIDENCE_THRESHOLD → is_valid=False."""
-        low_conf = _curl_keypoints(elbow_angle=90, confidence=0.3)
-        result, _ = _feed_phase(self.curl, low_conf, 3, 0.0)
+    def test_rep_counted_with_default_smoothing(self):
+        """Same rep with production smoothing settings (slower filter convergence)."""
+        curl = BicepCurl({"side": "right"})
+
+        _, t = _feed_phase(curl, self.extended, _REALISTIC_FRAMES_PER_PHASE, 0.0)
+        result, _ = _feed_phase(curl, self.flexed, _REALISTIC_FRAMES_PER_PHASE, t)
 
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.correction, "err_body_not_visible")
+        self.assertEqual(result.reps, 1)
 
 
 # ---------------------------------------------------------------------------
@@ -200,13 +225,17 @@ class TestCurlIntegration(unittest.TestCase):
 class TestSquatIntegration(unittest.TestCase):
     """End-to-end rep counting for Squat."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loop-invariant poses, built once for the whole class
+        cls.standing, cls.squatting = map(_frozen, _squat_keypoints_batch((170, 80)))
+
     def setUp(self):
-        self.squat = Squat({"side": "right"})
+        self.squat = Squat({"side": "right", **_PASSTHROUGH_SMOOTHING})
 
     def test_full_rep_counted(self):
         """Standing→Squat→Standing = 1 rep (standard logic)."""
-        standing = _squat_keypoints(knee_angle=170)
-        squatting = _squat_keypoints(knee_angle=80)
+        standing, squatting = self.standing, self.squatting
 
         t = 0.0
         _, t = _feed_phase(self.squat, standing, _FRAMES_PER_PHASE, t)
@@ -217,8 +246,7 @@ class TestSquatIntegration(unittest.TestCase):
 
     def test_two_reps_counted(self):
         """Two up→down→up cycles = 2 reps."""
-        standing = _squat_keypoints(knee_angle=170)
-        squatting = _squat_keypoints(knee_angle=80)
+        standing, squatting = self.standing, self.squatting
 
         t = 0.0
         for _ in range(2):
@@ -228,13 +256,16 @@ class TestSquatIntegration(unittest.TestCase):
 
         self.assertEqual(self.squat.reps, 2)
 
-    def test_low_confidence_rejects(self):
-        """Keypoints below CONFIDENCE_THRESHOLD → is_valid=False."""
-        low_conf = _squat_keypoints(knee_angle=120, confidence=0.3)
-        result, _ = _feed_phase(self.squat, low_conf, 3, 0.0)
+    def test_rep_counted_with_default_smoothing(self):
+        """Same rep with production smoothing settings (slower filter convergence)."""
+        squat = Squat({"side": "right"})
+
+        t = 0.0
+        _, t = _feed_phase(squat, self.standing, _REALISTIC_FRAMES_PER_PHASE, t)
+        _, t = _feed_phase(squat, self.squatting, _REALISTIC_FRAMES_PER_PHASE, t)
+        result, _ = _feed_phase(squat, self.standing, _REALISTIC_FRAMES_PER_PHASE, t)
 
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.correction, "err_body_not_visible")
+        self.assertEqual(result.reps, 1)
 
 
 # ---------------------------------------------------------------------------
@@ -244,13 +275,18 @@ class TestSquatIntegration(unittest.TestCase):
 class TestPushUpIntegration(unittest.TestCase):
     """End-to-end rep counting and form feedback for PushUp."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loop-invariant poses, built once for the whole class
+        cls.up = _frozen(_pushup_keypoints(elbow_extended=True, body_straight=True))
+        cls.down = _frozen(_pushup_keypoints(elbow_extended=False, body_straight=True))
+
     def setUp(self):
-        self.pushup = PushUp({"side": "left"})
+        self.pushup = PushUp({"side": "left", **_PASSTHROUGH_SMOOTHING})
 
     def test_full_rep_counted(self):
         """Extended→Bent→Extended = 1 rep."""
-        up = _pushup_keypoints(elbow_extended=True, body_straight=True)
-        down = _pushup_keypoints(elbow_extended=False, body_straight=True)
+        up, down = self.up, self.down
 
         t = 0.0
         _, t = _feed_phase(self.pushup, up, _FRAMES_PER_PHASE, t)
@@ -259,6 +295,17 @@ class TestPushUpIntegration(unittest.TestCase):
 
         self.assertEqual(result.reps, 1)
 
+    def test_rep_counted_with_default_smoothing(self):
+        """Same rep with production smoothing settings (slower filter convergence)."""
+        pushup = PushUp({"side": "left"})
+
+        t = 0.0
+        _, t = _feed_phase(pushup, self.up, _REALISTIC_FRAMES_PER_PHASE, t)
+        _, t = _feed_phase(pushup, self.down, _REALISTIC_FRAMES_PER_PHASE, t)
+        result, _ = _feed_phase(pushup, self.up, _REALISTIC_FRAMES_PER_PHASE, t)
+
+        self.assertEqual(result.reps, 1)
+
     def test_bad_body_form_triggers_feedback(self):
         """Body angle < FORM_ANGLE_MIN → pushup_warn_back correction."""
         bad_form = _pushup_keypoints(elbow_extended=True, body_straight=False)
@@ -266,13 +313,30 @@ class TestPushUpIntegration(unittest.TestCase):
 
         self.assertEqual(result.correction, "pushup_warn_back")
 
+
+# ---------------------------------------------------------------------------
+# Low-Confidence Rejection (shared by all rep-based exercises)
+# ---------------------------------------------------------------------------
+
+class TestLowConfidenceRejection(unittest.TestCase):
+    """Keypoints below CONFIDENCE_THRESHOLD → is_valid=False, for every rep exercise."""
+
+    CASES = (
+        ("curl", lambda: BicepCurl({"side": "right"}),
+         lambda: _curl_keypoints(elbow_angle=90, confidence=0.3)),
+        ("squat", lambda: Squat({"side": "right"}),
+         lambda: _squat_keypoints(knee_angle=120, confidence=0.3)),
+        ("pushup", lambda: PushUp({"side": "left"}),
+         lambda: _pushup_keypoints(confidence=0.3)),
+    )
+
     def test_low_confidence_rejects(self):
-        """Keypoints below CONFIDENCE_THRESHOLD → is_valid=False."""
-        low_conf = _pushup_keypoints(confidence=0.3)
-        result, _ = _feed_phase(self.pushup, low_conf, 3, 0.0)
+        for name, make_exercise, make_keypoints in self.CASES:
+            with self.subTest(exercise=name):
+                result, _ = _feed_phase(make_exercise(), make_keypoints(), 3, 0.0)
 
-        self.assertFalse(result.is_valid)
-        self.assertEqual(result.correction, "err_body_not_visible")
+                self.assertFalse(result.is_valid)
+                self.assertEqual(result.correction, "err_body_not_visible")
 
 
 # ---------------------------------------------------------------------------
@@ -282,12 +346,18 @@ class TestPushUpIntegration(unittest.TestCase):
 class TestPlankIntegration(unittest.TestCase):
     """Full lifecycle and form feedback for Plank (StaticDurationCounter)."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Loop-invariant poses, built once for the whole class
+        cls.good = _frozen(_plank_keypoints(body_straight=True, elbow_correct=True))
+        cls.bad = _frozen(_plank_keypoints(body_straight=False, elbow_correct=True))
+
     def setUp(self):
         self.plank = Plank({"side": "left"})
 
     def test_full_lifecycle(self):
         """waiting → countdown → active → finished."""
-        good = _plank_keypoints(body_straight=True, elbow_correct=True)
+        good = self.good
 
         # 1. First frame: waiting → countdown
         result = self.plank.process_frame(good, timestamp=0.0)
@@ -308,27 +378,27 @@ class TestPlankIntegration(unittest.TestCase):
         self.assertEqual(result.reps, 5)
 
         # 5. Break form → finished
-        bad = _plank_keypoints(body_straight=False, elbow_correct=True)
+        bad = self.bad
         result = self.plank.process_frame(bad, timestamp=9.0)
         self.assertEqual(result.stage, "finished")
         self.assertEqual(result.reps, 5)
 
     def test_bad_form_triggers_finished(self):
         """Bad body angle during active → transitions to finished."""
-        good = _plank_keypoints(body_straight=True, elbow_correct=True)
+        good = self.good
 
         # Get to active state
         self.plank.process_frame(good, timestamp=0.0)
         self.plank.process_frame(good, timestamp=3.1)
 
         # Break form while active → FSM goes to finished
-        bad = _plank_keypoints(body_straight=False, elbow_correct=True)
+        bad = self.bad
         result = self.plank.process_frame(bad, timestamp=4.0)
         self.assertEqual(result.stage, "finished")
 
     def test_reset_clears_state(self):
         """After lifecycle, reset() returns to waiting with 0 reps."""
-        good = _plank_keypoints(body_straight=True, elbow_correct=True)
+        good = self.good
 
         self.plank.process_frame(good, timestamp=0.0)
         self.plank.process_frame(good, timestamp=3.1)
@@ -1,9 +1,15 @@
+"""
+Unit Tests for the FSM counters.
+
+Tests cover:
+- RepetitionCounter: hysteresis, debouncing, inverted logic, state prefixes
+- StaticDurationCounter: waiting -> countdown -> active -> finished lifecycle
+
+Run with: python -m pytest tests/test_fsm.py -v
+"""
 import unittest
-import sys
-import os
 
-# Add project root to path to allow importing src
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
 from src.core.fsm import RepetitionCounter
 from config.settings import HYSTERESIS_TOLERANCE
@@ -138,13 +144,30 @@ class TestRepetitionCounter(unittest.TestCase):
         reps, state = fsm.process(80)
         self.assertEqual(state, "down")  # No prefix
 
+    def test_process_batch_matches_process(self):
+        """process_batch over a series == process() frame by frame."""
+        angles = np.array([170, 170, 80, 0, 80, 80, 96, 170, 170, 80, 80, 170, 170], dtype=float)
+        
+        batch_reps, batch_states = self.fsm.process_batch(angles)
+        
+        reference = RepetitionCounter(up_threshold=160, down_threshold=90, start_stage="up")
+        expected = [reference.process(a) for a in angles]
+        
+        self.assertEqual(list(zip(batch_reps.tolist(), batch_states)), expected)
+        self.assertEqual(self.fsm.reps, 2)
+        self.assertEqual(self.fsm.state, reference.state)
+
 
 class TestStaticDurationCounter(unittest.TestCase):
     """Tests for StaticDurationCounter (Plank, Wall Sit, etc.)."""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         from src.core.fsm import StaticDurationCounter
-        self.fsm = StaticDurationCounter(stability_duration=3.0)
+        cls.fsm = StaticDurationCounter(stability_duration=3.0)
+    
+    def setUp(self):
+        self.fsm.reset()
     
     def test_waiting_to_countdown(self):
         """Valid form triggers countdown."""
@@ -1,7 +1,8 @@
 """
 Unit Tests for Geometry Module - Edge Cases.
 
-Tests the calculate_angle() function for:
+Tests the calculate_angle() function (and its vectorized
+calculate_angles() counterpart) for:
 - Standard angle calculations
 - Edge cases (zero-length vectors, collinear points)
 - Numeric precision and boundary conditions
@@ -9,14 +10,11 @@ Tests the calculate_angle() function for:
 Run with: python -m pytest tests/test_geometry.py -v
 """
 import unittest
-import sys
-import os
 import math
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
-from src.utils.geometry import calculate_angle
+from src.utils.geometry import calculate_angle, calculate_angles, mean_triplet_angle
 
 
 class TestCalculateAngleStandard(unittest.TestCase):
@@ -198,16 +196,16 @@ class TestCalculateAnglePrecision(unittest.TestCase):
         # Should be close to 0 (both vectors pointing right from B)
         self.assertLess(angle, 1.0)
     
-    def test_result_is_rounded(self):
-        """Test that result is rounded to 2 decimal places."""
-        a = (0.0, 0.0)
-        b = (1.0, 0.0)
-        c = (1.0, 1.0)
+    def test_result_is_unrounded_float(self):
+        """Test that result is a plain float at full precision (no rounding)."""
+        a = (1.0, 0.0)
+        b = (0.0, 0.0)
+        c = (1.0, 2.0)
         
         angle = calculate_angle(a, b, c)
-        # Check that it's rounded (no more than 2 decimal places)
-        rounded = round(angle, 2)
-        self.assertEqual(angle, rounded)
+        self.assertIsInstance(angle, float)
+        # atan(2) in degrees = 63.43494882...; rounding would give 63.43
+        self.assertAlmostEqual(angle, math.degrees(math.atan(2.0)), places=9)
     
     def test_symmetry(self):
         """Test that angle(a,b,c) == angle(c,b,a)."""
@@ -221,5 +219,48 @@ class TestCalculateAnglePrecision(unittest.TestCase):
         self.assertEqual(angle1, angle2)
 
 
+class TestCalculateAnglesVectorized(unittest.TestCase):
+    """Test the batched calculate_angles() against the scalar kernel."""
+    
+    def test_matches_scalar_kernel(self):
+        """Each row equals calculate_angle() on the same triplet."""
+        rng = np.random.default_rng(0)
+        points = rng.normal(scale=100.0, size=(64, 3, 2))
+        points[0, 1] = points[0, 0]  # Degenerate row (a == b)
+        
+        angles = calculate_angles(points[:, 0], points[:, 1], points[:, 2])
+        
+        self.assertEqual(angles.shape, (64,))
+        for row, angle in zip(points, angles):
+            self.assertAlmostEqual(angle, calculate_angle(*row), places=9)
+        self.assertEqual(angles[0], 0.0)
+
+
+class TestMeanTripletAngle(unittest.TestCase):
+    """Test the compiled multi-side angle kernel used for side='both'."""
+    
+    def setUp(self):
+        self.kp = np.zeros((17, 3))
+        self.kp[[5, 7, 9], :2] = [(0, 1), (0, 0), (1, 0)]   # 90°
+        self.kp[[6, 8, 10], :2] = [(0, 1), (0, 0), (0, -1)]  # 180°
+        self.kp[:, 2] = 0.9
+        self.triplets = np.array([(5, 7, 9), (6, 8, 10)], dtype=np.intp)
+    
+    def test_mean_of_sides(self):
+        """Both sides visible -> mean of the two angles."""
+        angle = mean_triplet_angle(self.kp, self.kp, self.triplets, 0.5)
+        self.assertAlmostEqual(angle, 135.0, places=9)
+    
+    def test_low_confidence_side_gives_nan(self):
+        """Any keypoint below threshold invalidates the whole measurement."""
+        self.kp[10, 2] = 0.2
+        self.assertTrue(math.isnan(mean_triplet_angle(self.kp, self.kp, self.triplets, 0.5)))
+    
+    def test_missing_keypoints_give_nan(self):
+        """Truncated input is rejected instead of read out of bounds."""
+        short = self.kp[:9]
+        self.assertTrue(math.isnan(mean_triplet_angle(short, short, self.triplets, 0.5)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -64,3 +64,33 @@ class TestGestureDetector(unittest.TestCase):
              gesture = self.detector.detect(keypoints)
              
         self.assertEqual(gesture, "THUMBS_UP")
+
+    def test_zero_stability_never_reports(self):
+        """stability_frames=0 keeps no history and never confirms a gesture."""
+        detector = GestureDetector(stability_frames=0)
+        keypoints = np.zeros((17, 3))
+        keypoints[6] = [300, 300, 0.9]
+        keypoints[10] = [300, 200, 0.9]  # Raised
+        
+        for _ in range(3):
+            self.assertIsNone(detector.detect(keypoints))
+        self.assertEqual(detector.gesture_history, ())
+
+    def test_gesture_history_order_and_reset(self):
+        """gesture_history lists the window oldest first; reset() empties it."""
+        raised = np.zeros((17, 3))
+        raised[6] = [300, 300, 0.9]
+        raised[10] = [300, 200, 0.9]
+        
+        self.detector.detect(None)
+        for _ in range(5):
+            self.detector.detect(raised)
+        self.assertEqual(self.detector.gesture_history, ("THUMBS_UP",) * 5)
+        
+        self.detector.detect(None)
+        self.assertEqual(self.detector.gesture_history, ("THUMBS_UP",) * 4 + (None,))
+        
+        self.detector.reset()
+        self.assertEqual(self.detector.gesture_history, ())
+        self.detector.detect(None)
+        self.assertEqual(self.detector.gesture_history, (None,))
@@ -0,0 +1,55 @@
+"""
+Unit Tests for the structure-of-arrays KeypointBatch.
+
+Tests KeypointBatch for:
+- Joint-major layout built from YOLO (17, 3) / (N, 17, 3) arrays
+- Per-frame joint angles matching calculate_angle()
+- Confidence visibility masks
+
+Run with: python -m pytest tests/test_keypoints.py -v
+"""
+import unittest
+import numpy as np
+
+from src.core.keypoints import KeypointBatch
+from src.utils.geometry import calculate_angle
+
+
+class TestKeypointBatch(unittest.TestCase):
+    """Test SoA conversion and vectorized per-joint queries."""
+    
+    @classmethod
+    def setUpClass(cls):
+        rng = np.random.default_rng(0)
+        cls.frames = rng.uniform(0, 640, size=(8, 17, 3)).astype(np.float32)
+        cls.frames[..., 2] = rng.uniform(0, 1, size=(8, 17))
+        cls.batch = KeypointBatch.from_array(cls.frames)
+    
+    def test_layout_is_joint_major(self):
+        """Each channel is (17, N) with contiguous per-joint rows."""
+        self.assertEqual(self.batch.n_frames, 8)
+        for channel in self.batch:
+            self.assertEqual(channel.shape, (17, 8))
+            self.assertTrue(channel[6].flags.c_contiguous)
+        np.testing.assert_array_equal(self.batch.ys[8], self.frames[:, 8, 1])
+    
+    def test_single_frame_input(self):
+        """A plain (17, 3) array becomes a one-frame batch."""
+        batch = KeypointBatch.from_array(self.frames[0])
+        self.assertEqual(batch.n_frames, 1)
+    
+    def test_joint_angles_match_scalar(self):
+        """Vectorized angles equal calculate_angle() frame by frame."""
+        angles = self.batch.joint_angles(6, 8, 10)
+        expected = [calculate_angle(kp[6], kp[8], kp[10]) for kp in self.frames]
+        np.testing.assert_allclose(angles, expected, atol=1e-3)
+    
+    def test_visible_mask(self):
+        """visible() requires every listed joint to reach the threshold."""
+        mask = self.batch.visible((6, 8, 10), 0.5)
+        expected = (self.frames[:, (6, 8, 10), 2] >= 0.5).all(axis=1)
+        np.testing.assert_array_equal(mask, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Unit Tests for Performance Utilities.
+
+Tests FPSCounter for:
+- Moving-average FPS from tick()
+- Read-only accessors (get_fps, get_frame_time_ms) not recording frames
+
+Run with: python -m pytest tests/test_performance.py -v
+"""
+import unittest
+from unittest.mock import patch
+
+from src.utils.performance import FPSCounter
+
+
+class TestFPSCounter(unittest.TestCase):
+    """Test FPS measurement with a controlled clock."""
+    
+    def _tick_at(self, counter, timestamps):
+        fps = 0.0
+        with patch("src.utils.performance.time.perf_counter", side_effect=timestamps):
+            for _ in timestamps:
+                fps = counter.tick()
+        return fps
+    
+    def test_zero_before_two_ticks(self):
+        """No FPS can be computed from a single timestamp."""
+        counter = FPSCounter()
+        self.assertEqual(self._tick_at(counter, [1.0]), 0.0)
+        self.assertEqual(counter.get_fps(), 0.0)
+        self.assertEqual(counter.get_frame_time_ms(), 0.0)
+    
+    def test_steady_frame_rate(self):
+        """Constant 50 ms frames report 20 FPS."""
+        counter = FPSCounter(window_size=10)
+        fps = self._tick_at(counter, [i * 0.05 for i in range(20)])
+        self.assertAlmostEqual(fps, 20.0, places=6)
+        self.assertAlmostEqual(counter.get_frame_time_ms(), 50.0, places=6)
+    
+    def test_accessors_do_not_record_frames(self):
+        """get_fps/get_frame_time_ms must not alter the measurement."""
+        counter = FPSCounter()
+        self._tick_at(counter, [0.0, 0.1])
+        with patch("src.utils.performance.time.perf_counter") as clock:
+            fps = counter.get_fps()
+            frame_ms = counter.get_frame_time_ms()
+            clock.assert_not_called()
+        self.assertAlmostEqual(fps, 10.0, places=6)
+        self.assertAlmostEqual(frame_ms, 100.0, places=6)
+    
+    def test_reset(self):
+        """Reset clears the timing state."""
+        counter = FPSCounter()
+        self._tick_at(counter, [0.0, 0.1])
+        counter.reset()
+        self.assertEqual(counter.get_fps(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
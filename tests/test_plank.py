@@ -1,11 +1,11 @@
+"""
+Tests for Plank form analysis and hold timing.
+
+Run with: python -m pytest tests/test_plank.py -v
+"""
 import unittest
 import numpy as np
 import time
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.exercises.plank import Plank
 from config.settings import PLANK_THRESHOLDS
@@ -19,7 +19,7 @@ class TestPlank(unittest.TestCase):
         # Create a simple stickman with desired angles
         # Indices: 5:Sh, 7:El, 9:Wr, 11:Hip, 15:Ank (Left)
         # We'll just position them to mathematically satisfy the angles
-        landmarks = np.zeros((33, 3))
+        landmarks = np.zeros((33, 3), dtype=np.float32)
         # Confidence = 1.0
         landmarks[:, 2] = 1.0
         
@@ -6,18 +6,13 @@ Tests cover:
 - MockPoseEstimator loop functionality
 - Integration with test helpers
 
-Run with: python tests/test_pose_estimator.py -v
+Run with: python -m pytest tests/test_pose_estimator.py -v
 """
 import unittest
-import sys
-import os
 import numpy as np
 from dataclasses import dataclass
 from typing import Optional
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from tests.mocks.mock_pose import MockPoseEstimator
 from tests.helpers import create_dummy_frame
 
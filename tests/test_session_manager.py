@@ -10,13 +10,8 @@ Tests the SessionManager state machine:
 Run with: python -m pytest tests/test_session_manager.py -v
 """
 import unittest
-import sys
-import os
 import numpy as np
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.core.session_manager import SessionManager
 from src.core.entities.workout_state import WorkoutState
 from src.core.interfaces import Exercise, AnalysisResult
@@ -59,12 +54,17 @@ class MockExercise(Exercise):
         self.reps = reps
 
 
+# Read-only keypoints shared by every MockKeypointExtractor (seeded, drawn once per module)
+_MOCK_KEYPOINTS = (np.random.default_rng(0).random((17, 3)) * 0.9 + 0.1).astype(np.float32)
+_MOCK_KEYPOINTS.flags.writeable = False
+
+
 class MockKeypointExtractor(KeypointExtractor):
     """Mock KeypointExtractor for testing."""
     
-    def __init__(self, has_people: bool = True):
+    def __init__(self, has_people: bool = True, keypoints: np.ndarray = None):
         self._has_people = has_people
-        self._keypoints = np.random.rand(17, 3) * 0.9 + 0.1
+        self._keypoints = _MOCK_KEYPOINTS if keypoints is None else keypoints
     
     def extract(self, pose_data):
         """Returns mock extraction result."""
@@ -74,12 +74,30 @@ class MockKeypointExtractor(KeypointExtractor):
 class MockDatabaseManager:
     """Mock database manager for testing session persistence."""
     
+    __slots__ = ("save_count", "last_saved_session")
+    
     def __init__(self):
-        self.saved_sessions = []
+        self.save_count = 0
+        self.last_saved_session = None
     
     def save_session(self, session):
-        """Records session saves for verification."""
-        self.saved_sessions.append(session)
+        """Counts session saves and keeps the latest for identity checks."""
+        self.save_count += 1
+        self.last_saved_session = session
+
+
+def _complete_set(sm, exercise, timestamp=0.0):
+    """Reaches the target reps and lets one update() close the set."""
+    exercise.set_reps(sm.target_reps)
+    return sm.update(pose_data=None, timestamp=timestamp)
+
+
+def _drive_to_finished(sm, exercise):
+    """Completes every set, continuing through each REST."""
+    for _ in range(sm.target_sets):
+        _complete_set(sm, exercise)
+        if sm.workout_state == WorkoutState.REST:
+            sm.handle_user_input('CONTINUE')
 
 
 # =============================================================================
@@ -89,13 +107,17 @@ class MockDatabaseManager:
 class TestSessionManagerInitialization(unittest.TestCase):
     """Test SessionManager initialization and initial state."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
     
-    def test_initial_state_is_exercise(self):
-        """Session should start in EXERCISE state."""
+    def test_initial_state(self):
+        """Session should start in EXERCISE state, at set 1, not finished."""
         sm = SessionManager(
             db_manager=self.mock_db,
             user_id=1,
@@ -105,42 +127,25 @@ class TestSessionManagerInitialization(unittest.TestCase):
             target_reps=10
         )
         
-        self.assertEqual(sm.workout_state, WorkoutState.EXERCISE)
-    
-    def test_initial_set_is_one(self):
-        """Session should start at set 1."""
-        sm = SessionManager(
-            db_manager=self.mock_db,
-            user_id=1,
-            exercise=self.mock_exercise,
-            keypoint_extractor=self.mock_extractor,
-            target_sets=3,
-            target_reps=10
-        )
-        
-        self.assertEqual(sm.current_set, 1)
-    
-    def test_session_not_finished_initially(self):
-        """Session should not be finished at start."""
-        sm = SessionManager(
-            db_manager=self.mock_db,
-            user_id=1,
-            exercise=self.mock_exercise,
-            keypoint_extractor=self.mock_extractor,
-            target_sets=3,
-            target_reps=10
-        )
-        
-        self.assertFalse(sm.is_session_finished())
+        with self.subTest("state"):
+            self.assertEqual(sm.workout_state, WorkoutState.EXERCISE)
+        with self.subTest("set"):
+            self.assertEqual(sm.current_set, 1)
+        with self.subTest("finished"):
+            self.assertFalse(sm.is_session_finished())
 
 
 class TestSessionManagerStateTransitions(unittest.TestCase):
     """Test state transitions: EXERCISE -> REST -> EXERCISE -> FINISHED."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
         
         # 3 sets of 5 reps
         self.sm = SessionManager(
@@ -154,24 +159,15 @@ class TestSessionManagerStateTransitions(unittest.TestCase):
     
     def test_complete_set_transitions_to_rest(self):
         """Completing a set (not final) should transition to REST."""
-        # Simulate reaching target reps
-        self.mock_exercise.set_reps(5)
-        
-        # Process frame triggers set completion
-        self.sm.update(pose_data=None, timestamp=0.0)
+        # Reaching target reps: the next frame triggers set completion
+        _complete_set(self.sm, self.mock_exercise)
         
         self.assertEqual(self.sm.workout_state, WorkoutState.REST)
     
     def test_complete_final_set_transitions_to_finished(self):
         """Completing the final set should transition to FINISHED."""
         # Simulate 3 complete sets
-        for set_num in range(1, 4):
-            self.mock_exercise.set_reps(5)
-            self.sm.update(pose_data=None, timestamp=float(set_num))
-            
-            if set_num < 3:
-                # Continue to next set
-                self.sm.handle_user_input('CONTINUE')
+        _drive_to_finished(self.sm, self.mock_exercise)
         
         self.assertEqual(self.sm.workout_state, WorkoutState.FINISHED)
         self.assertTrue(self.sm.is_session_finished())
@@ -179,8 +175,7 @@ class TestSessionManagerStateTransitions(unittest.TestCase):
     def test_continue_from_rest_increments_set(self):
         """CONTINUE from REST should increment set and return to EXERCISE."""
         # Complete first set
-        self.mock_exercise.set_reps(5)
-        self.sm.update(pose_data=None, timestamp=0.0)
+        _complete_set(self.sm, self.mock_exercise)
         self.assertEqual(self.sm.workout_state, WorkoutState.REST)
         self.assertEqual(self.sm.current_set, 1)
         
@@ -204,11 +199,7 @@ class TestSessionManagerStateTransitions(unittest.TestCase):
     def test_continue_ignored_in_finished_state(self):
         """CONTINUE should be ignored when in FINISHED state."""
         # Complete all sets
-        for _ in range(3):
-            self.mock_exercise.set_reps(5)
-            self.sm.update(pose_data=None, timestamp=0.0)
-            if self.sm.workout_state == WorkoutState.REST:
-                self.sm.handle_user_input('CONTINUE')
+        _drive_to_finished(self.sm, self.mock_exercise)
         
         self.assertEqual(self.sm.workout_state, WorkoutState.FINISHED)
         
@@ -221,10 +212,14 @@ class TestSessionManagerStateTransitions(unittest.TestCase):
 class TestSessionManagerExerciseReset(unittest.TestCase):
     """Test exercise reset behavior after set completion."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
         
         self.sm = SessionManager(
             db_manager=self.mock_db,
@@ -237,8 +232,7 @@ class TestSessionManagerExerciseReset(unittest.TestCase):
     
     def test_exercise_reset_on_set_completion(self):
         """Exercise logic should reset after completing a set."""
-        self.mock_exercise.set_reps(5)
-        self.sm.update(pose_data=None, timestamp=0.0)
+        _complete_set(self.sm, self.mock_exercise)
         
         self.assertTrue(self.mock_exercise._reset_called)
 
@@ -246,10 +240,14 @@ class TestSessionManagerExerciseReset(unittest.TestCase):
 class TestSessionManagerPersistence(unittest.TestCase):
     """Test session data persistence."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
         
         self.sm = SessionManager(
             db_manager=self.mock_db,
@@ -263,19 +261,15 @@ class TestSessionManagerPersistence(unittest.TestCase):
     def test_session_saved_on_finish(self):
         """Session should be saved to database when workout finishes."""
         # Complete all sets
-        for _ in range(2):
-            self.mock_exercise.set_reps(3)
-            self.sm.update(pose_data=None, timestamp=0.0)
-            if self.sm.workout_state == WorkoutState.REST:
-                self.sm.handle_user_input('CONTINUE')
+        _drive_to_finished(self.sm, self.mock_exercise)
         
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
     
     def test_save_session_method(self):
         """save_session() should trigger end_session and database save."""
         self.sm.save_session()
         
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
     
     def test_end_session_only_saves_once(self):
         """Multiple end_session() calls should only save once."""
@@ -283,16 +277,20 @@ class TestSessionManagerPersistence(unittest.TestCase):
         self.sm.end_session()
         self.sm.end_session()
         
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
 
 
 class TestSessionManagerUIState(unittest.TestCase):
     """Test UIState output from update()."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
         
         self.sm = SessionManager(
             db_manager=self.mock_db,
@@ -319,8 +317,7 @@ class TestSessionManagerUIState(unittest.TestCase):
         self.assertEqual(ui_state.workout_state, "EXERCISE")
         
         # After completing set
-        self.mock_exercise.set_reps(10)
-        ui_state = self.sm.update(pose_data=None, timestamp=1.0)
+        ui_state = _complete_set(self.sm, self.mock_exercise, timestamp=1.0)
         self.assertEqual(ui_state.workout_state, "REST")
 
 class MockCloudUploader:
@@ -340,10 +337,14 @@ class MockCloudUploader:
 class TestSessionManagerCloudIntegration(unittest.TestCase):
     """Test cloud uploader integration in SessionManager."""
     
+    @classmethod
+    def setUpClass(cls):
+        # Stateless: one extractor serves every test in the class
+        cls.mock_extractor = MockKeypointExtractor()
+    
     def setUp(self):
         self.mock_db = MockDatabaseManager()
         self.mock_exercise = MockExercise()
-        self.mock_extractor = MockKeypointExtractor()
         self.mock_cloud = MockCloudUploader()
     
     def _create_sm(self, cloud_uploader=None):
@@ -363,17 +364,13 @@ class TestSessionManagerCloudIntegration(unittest.TestCase):
         sm = self._create_sm(cloud_uploader=self.mock_cloud)
         
         # Complete all sets
-        for _ in range(2):
-            self.mock_exercise.set_reps(3)
-            sm.update(pose_data=None, timestamp=0.0)
-            if sm.workout_state == WorkoutState.REST:
-                sm.handle_user_input('CONTINUE')
+        _drive_to_finished(sm, self.mock_exercise)
         
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
         self.assertEqual(len(self.mock_cloud.uploaded_sessions), 1)
         # Both should receive the same session entity
         self.assertIs(
-            self.mock_db.saved_sessions[0],
+            self.mock_db.last_saved_session,
             self.mock_cloud.uploaded_sessions[0]
         )
     
@@ -383,7 +380,7 @@ class TestSessionManagerCloudIntegration(unittest.TestCase):
         
         sm.save_session()
         
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
         # No crash, no cloud upload
     
     def test_cloud_upload_failure_does_not_break_session(self):
@@ -392,14 +389,10 @@ class TestSessionManagerCloudIntegration(unittest.TestCase):
         sm = self._create_sm(cloud_uploader=failing_cloud)
         
         # Complete all sets
-        for _ in range(2):
-            self.mock_exercise.set_reps(3)
-            sm.update(pose_data=None, timestamp=0.0)
-            if sm.workout_state == WorkoutState.REST:
-                sm.handle_user_input('CONTINUE')
+        _drive_to_finished(sm, self.mock_exercise)
         
         # Local save should still work
-        self.assertEqual(len(self.mock_db.saved_sessions), 1)
+        self.assertEqual(self.mock_db.save_count, 1)
         # Cloud upload was attempted but failed — no uploaded sessions
         self.assertEqual(len(failing_cloud.uploaded_sessions), 0)
         # Session should be marked as finished
@@ -1,23 +1,26 @@
+"""
+Tests for the SessionManager REST state UI.
+
+Run with: python -m pytest tests/test_session_rest.py -v
+"""
 import unittest
 from unittest.mock import MagicMock
-import sys
-import os
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import numpy as np
 
 from src.core.session_manager import SessionManager, WorkoutState
 from src.core.entities.ui_state import UIState
+from src.core.protocols import DatabaseManagerProtocol, KeypointExtractor
 
 class TestSessionManagerRestState(unittest.TestCase):
     def setUp(self):
-        self.mock_db = MagicMock()
+        self.mock_db = MagicMock(spec=DatabaseManagerProtocol)
         self.mock_exercise = MagicMock()
         self.mock_exercise.display_name_key = "test_exercise"
         self.mock_exercise.stage = "waiting" # Default reset state
-        self.mock_extractor = MagicMock()
-        self.mock_extractor.extract.return_value = (True, [[0,0,0]])
-        
+        self.mock_extractor = MagicMock(spec=KeypointExtractor)
+        self.mock_extractor.extract.return_value = (True, np.zeros((1, 3), dtype=np.float32))
+
         self.manager = SessionManager(
             db_manager=self.mock_db,
             user_id=1,
@@ -1,35 +1,34 @@
-import sys
-import os
+"""
+Tests for the One Euro smoothing filters.
+
+Tests cover:
+- OneEuroFilter: jitter reduction on a noisy signal
+- PointSmoother: 2D smoothing and fast-movement tracking
+- BatchOneEuroFilter: parity with PointSmoother, float32 preservation
+
+Run with: python -m pytest tests/test_smoothing.py -v
+"""
 import numpy as np
-import time
 
-# Add root to path for importing src
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.utils.smoothing import OneEuroFilter, PointSmoother, BatchOneEuroFilter
 
-from src.utils.smoothing import OneEuroFilter, PointSmoother
 
 def test_one_euro_filter():
-    print("Testing OneEuroFilter...")
-    
     # Filter configuration
     min_cutoff = 1.0
     beta = 0.0
     f = OneEuroFilter(min_cutoff=min_cutoff, beta=beta)
     
     # Generate noisy signal (sine wave + noise)
-    t = np.linspace(0, 5, 100)
+    t = np.linspace(0, 5, 32)
     signal = np.sin(t)
-    noise = np.random.normal(0, 0.1, size=len(t))
+    noise = np.random.default_rng(0).normal(0, 0.1, size=len(t))
     noisy_signal = signal + noise
     
-    filtered_signal = []
-    start_time = time.time()
+    start_time = 0.0  # Fixed epoch: deterministic timestamps
     
-    for i, val in enumerate(noisy_signal):
-        # Simulate real-time
-        current_time = start_time + t[i]
-        filtered_val = f(val, current_time)
-        filtered_signal.append(filtered_val)
+    # Simulate real-time: one filter call per sample
+    filtered_signal = [f(val, start_time + t[i]) for i, val in enumerate(noisy_signal)]
         
     # Calculate Jitter reduction (Variance of differences/derivative)
     # Objective is to reduce high frequency fluctuations
@@ -40,36 +39,60 @@ def test_one_euro_filter():
     noisy_jitter = np.var(noisy_diff)
     filtered_jitter = np.var(filtered_diff)
     
-    print(f"Original Jitter (Var of diff): {noisy_jitter:.4f}")
-    print(f"Filtered Jitter (Var of diff): {filtered_jitter:.4f}")
-    
-    if filtered_jitter < noisy_jitter:
-        print("PASS: Jitter reduced.")
-    else:
-        print("FAIL: Jitter not reduced.")
+    assert filtered_jitter < noisy_jitter, (
+        f"Jitter not reduced: {filtered_jitter:.4f} >= {noisy_jitter:.4f}"
+    )
+
 
 def test_point_smoother():
-    print("\nTesting PointSmoother...")
     ps = PointSmoother(min_cutoff=1.0, beta=1.0)
     
     p1 = (100, 100)
-    p2 = (105, 102) # Small movement
-    p3 = (200, 200) # Large jump (fast)
+    p2 = (105, 102)  # Small movement
+    p3 = (200, 200)  # Large jump (fast)
     
-    t0 = time.time()
+    t0 = 1000.0
     s1 = ps(p1, t0)
     s2 = ps(p2, t0 + 0.1)
     s3 = ps(p3, t0 + 0.2)
     
-    print(f"Input: {p1} -> Smoothed: {s1}")
-    print(f"Input: {p2} -> Smoothed: {s2}")
-    print(f"Input: {p3} -> Smoothed: {s3}")
-    
     # Check basic logic
     assert s1 == p1, "First point should be practically identical"
-    # s2 should be close to p2 but not necessarily identical (smoothing)
-    # s3 should follow p3 quickly due to beta
+    # s2 lies between p1 and p2 (smoothing)
+    assert p1[0] <= s2[0] <= p2[0] and p1[1] <= s2[1] <= p2[1]
+    # s3 follows the jump towards p3 (beta)
+    assert s2[0] < s3[0] <= p3[0] and s2[1] < s3[1] <= p3[1]
+
+
+def test_batch_filter_matches_point_smoother():
+    points = np.array([[100.0, 100.0], [50.0, 80.0], [10.0, 300.0]])
+    batch = BatchOneEuroFilter(len(points), min_cutoff=1.0, beta=1.0)
+    singles = [PointSmoother(min_cutoff=1.0, beta=1.0) for _ in points]
+    
+    t0 = 1000.0
+    for step in range(5):
+        frame = points + step * np.array([3.0, -2.0])
+        t = t0 + step * 0.1
+        smoothed = batch(frame, t)
+        expected = [ps(tuple(p), t) for ps, p in zip(singles, frame)]
+        assert np.allclose(smoothed, expected), "Batch and per-point filters diverged"
+
+
+def test_batch_filter_keeps_float32():
+    points = np.array([[100.0, 100.0], [50.0, 80.0]], dtype=np.float32)
+    batch32 = BatchOneEuroFilter(len(points), min_cutoff=1.0, beta=1.0)
+    batch64 = BatchOneEuroFilter(len(points), min_cutoff=1.0, beta=1.0)
+    
+    for step in range(5):
+        frame = points + np.float32(step * 3.0)
+        smoothed = batch32(frame, step * 0.1)
+        reference = batch64(frame.astype(np.float64), step * 0.1)
+        assert smoothed.dtype == np.float32, f"Expected float32, got {smoothed.dtype}"
+        assert np.allclose(smoothed, reference, atol=1e-3), "float32 path diverged from float64"
+
 
 if __name__ == "__main__":
     test_one_euro_filter()
     test_point_smoother()
+    test_batch_filter_matches_point_smoother()
+    test_batch_filter_keeps_float32()
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from src.core.entities.ui_state import UIState
+
+
+def _ui_state(keypoints=None):
+    return UIState(
+        exercise_name="Squat",
+        reps=0,
+        target_reps=10,
+        current_set=1,
+        target_sets=3,
+        state="start",
+        feedback_key="",
+        workout_state="EXERCISE",
+        keypoints=keypoints
+    )
+
+
+class TestKeypointsPayload(unittest.TestCase):
+    def test_coordinates_rounded_to_whole_pixels(self):
+        keypoints = np.array([[100.4, 200.6, 0.9], [10.5, 11.5, 0.8]], dtype=np.float32)
+        payload = _ui_state(keypoints).to_dict()["keypoints"]
+        self.assertEqual([p[:2] for p in payload], [[100.0, 201.0], [10.0, 12.0]])
+
+    def test_confidence_is_not_rounded(self):
+        # Just above the client's 0.5 visibility threshold: must stay above it
+        keypoints = np.array([[100.0, 200.0, 0.504]])
+        payload = _ui_state(keypoints).to_dict()["keypoints"]
+        self.assertAlmostEqual(payload[0][2], 0.504)
+        self.assertGreater(payload[0][2], 0.5)
+
+    def test_payload_is_json_ready_list(self):
+        keypoints = np.zeros((17, 3), dtype=np.float32)
+        payload = _ui_state(keypoints).to_dict()["keypoints"]
+        self.assertIsInstance(payload, list)
+        self.assertEqual(len(payload), 17)
+        self.assertIsInstance(payload[0][0], float)
+
+    def test_no_keypoints(self):
+        self.assertIsNone(_ui_state().to_dict()["keypoints"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,13 +10,8 @@ Tests cover:
 Run with: python -m pytest tests/test_visualizer.py -v
 """
 import unittest
-import sys
-import os
 import numpy as np
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from src.ui.visualizer import Visualizer
 from src.ui.skeleton_renderer import SkeletonRenderer
 from src.ui.dashboard_renderer import DashboardRenderer
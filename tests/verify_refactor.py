@@ -18,8 +18,8 @@ def test_refactoring():
     print("Instance created successfully.")
     
     # 2. Check Smoothers Initialization
-    if hasattr(curl, 'smoothers') and len(curl.smoothers) > 0:
-        print(f"PASS: Smoothers initialized ({len(curl.smoothers)} active).")
+    if curl.smoother is not None and len(curl.smoothed_indices) > 0:
+        print(f"PASS: Smoothers initialized ({len(curl.smoothed_indices)} active).")
     else:
         print("FAIL: Smoothers not initialized.")
         
@@ -4,7 +4,10 @@ const canvas = document.getElementById('skeleton-canvas');
 const ctx = canvas.getContext('2d');
 
 let translations = {};
-fetch('/api/translations').then(r => r.json()).then(data => translations = data);
+fetch('/api/translations').then(r => r.json()).then(data => {
+    translations = data;
+    lastDashboardKey = null; // overlay texts depend on translations
+});
 
 const exerciseNameEl = document.getElementById('exercise-name');
 const repCounterEl = document.getElementById('rep-counter');
@@ -36,14 +39,22 @@ function setProgress(current, total) {
     repRing.style.strokeDashoffset = offset;
 }
 
-// Resize canvas to match video aspect ratio properly
+// Resize canvas to match video aspect ratio properly.
+// Assigning width/height reallocates and clears the backing store even when
+// the value is unchanged, so only touch them when the frame size changes.
 function resizeCanvas() {
+    let width, height;
     if (videoImg.naturalWidth && videoImg.naturalHeight) {
-        canvas.width = videoImg.naturalWidth;
-        canvas.height = videoImg.naturalHeight;
+        width = videoImg.naturalWidth;
+        height = videoImg.naturalHeight;
     } else {
-        canvas.width = videoImg.clientWidth || 640;
-        canvas.height = videoImg.clientHeight || 480;
+        width = videoImg.clientWidth || 640;
+        height = videoImg.clientHeight || 480;
+    }
+    if (canvas.width !== width || canvas.height !== height) {
+        canvas.width = width;
+        canvas.height = height;
+        lastSkeleton = null; // resizing cleared the canvas
     }
 }
 window.addEventListener('resize', resizeCanvas);
@@ -55,6 +66,10 @@ let latestImageBlob = null;
 let previousRepCount = 0;
 let frameCount = 0;
 
+// Last rendered inputs, used to skip redundant DOM/canvas work
+let lastDashboardKey = null;
+let lastSkeleton = null;
+
 ws.onmessage = async (event) => {
     if (event.data instanceof Blob) {
         latestImageBlob = event.data;
@@ -84,7 +99,35 @@ ws.onclose = () => {
     console.log("WebSocket Closed");
 };
 
+// Feedback box appearance, resolved once instead of per frame
+const FEEDBACK_STYLE_VALID = { icon: "✓", className: 'feedback-box feedback-green' };
+const FEEDBACK_STYLE_INVALID = { icon: "!", className: 'feedback-box feedback-red' };
+
+// State pill colour per state category (anything else is green)
+const STATE_CATEGORY_COLORS = {
+    start: 'var(--accent-blue)',
+    neutral: 'var(--accent-blue)',
+    down: 'var(--accent-amber)',
+    transition: 'var(--accent-amber)'
+};
+
+// Everything updateDashboard reads except keypoints
+function dashboardKey(state) {
+    const sd = state.state_display;
+    return [
+        state.exercise_name, state.is_time_based, state.reps, state.target_reps,
+        state.current_set, state.target_sets, state.workout_state,
+        state.feedback_key, state.is_valid, state.language,
+        sd ? sd.label_key : '', sd ? sd.category : ''
+    ].join('|');
+}
+
 function updateDashboard(state) {
+    // Most frames only move the skeleton: skip the DOM writes entirely
+    const key = dashboardKey(state);
+    if (key === lastDashboardKey) return;
+    lastDashboardKey = key;
+
     exerciseNameEl.textContent = state.exercise_name;
     repLabelEl.textContent = state.is_time_based ? "Seconds" : "Reps";
     repCounterEl.textContent = `${state.reps}/${state.target_reps}`;
@@ -112,14 +155,9 @@ function updateDashboard(state) {
     // Feedback text and color mapping
     feedbackTextEl.textContent = state.feedback_key; 
     
-    feedbackBoxEl.className = 'feedback-box'; // reset
-    if (state.is_valid) {
-        feedbackIconEl.textContent = "✓";
-        feedbackBoxEl.classList.add('feedback-green');
-    } else {
-        feedbackIconEl.textContent = "!";
-        feedbackBoxEl.classList.add('feedback-red');
-    }
+    const fbStyle = state.is_valid ? FEEDBACK_STYLE_VALID : FEEDBACK_STYLE_INVALID;
+    feedbackIconEl.textContent = fbStyle.icon;
+    feedbackBoxEl.className = fbStyle.className;
     
     // State pill (Badge)
     if (state.state_display) {
@@ -129,13 +167,7 @@ function updateDashboard(state) {
         // categories are usually: start (blue), down (amber), up (green) 
         // This mapping overrides original BGR colors for a unified premium aesthetic
         const category = state.state_display.category.toLowerCase();
-        if (category === 'start' || category === 'neutral') {
-            stateIndicatorEl.style.backgroundColor = 'var(--accent-blue)';
-        } else if (category === 'down' || category === 'transition') {
-            stateIndicatorEl.style.backgroundColor = 'var(--accent-amber)';
-        } else {
-            stateIndicatorEl.style.backgroundColor = 'var(--accent-green)';
-        }
+        stateIndicatorEl.style.backgroundColor = STATE_CATEGORY_COLORS[category] || 'var(--accent-green)';
     }
 
     // Workout State overlays
@@ -156,15 +188,33 @@ function updateDashboard(state) {
     }
 }
 
-// Draw skeleton matching original OpenCV logic
-const POSE_CONNECTIONS = [
-    [15, 13], [13, 11], [16, 14], [14, 12], [11, 12], 
-    [5, 11], [6, 12], [5, 6], [5, 7], [6, 8], 
-    [7, 9], [8, 10], [1, 2], [0, 1], [0, 2], 
-    [1, 3], [2, 4], [3, 5], [4, 6]
-];
+// Draw skeleton matching original OpenCV logic.
+// Flat (start, end) index pairs, so the bone loop needs no per-pair array destructuring.
+const POSE_CONNECTIONS = new Uint8Array([
+    15, 13,  13, 11,  16, 14,  14, 12,  11, 12,
+    5, 11,   6, 12,   5, 6,    5, 7,    6, 8,
+    7, 9,    8, 10,   1, 2,    0, 1,    0, 2,
+    1, 3,    2, 4,    3, 5,    4, 6
+]);
+
+function sameKeypoints(a, b) {
+    if (a === b) return true;
+    if (!a || !b || a.length !== b.length) return false;
+    for (let i = 0; i < a.length; i++) {
+        const p = a[i], q = b[i];
+        if (p[0] !== q[0] || p[1] !== q[1] || p[2] !== q[2]) return false;
+    }
+    return true;
+}
 
 function drawSkeleton(keypoints, isValid) {
+    // A still subject yields identical keypoints: keep the previous drawing
+    if (lastSkeleton && lastSkeleton.isValid === isValid &&
+        sameKeypoints(lastSkeleton.keypoints, keypoints)) {
+        return;
+    }
+    lastSkeleton = { keypoints, isValid };
+
     ctx.clearRect(0, 0, canvas.width, canvas.height);
     if (!keypoints) return;
 
@@ -172,34 +222,34 @@ function drawSkeleton(keypoints, isValid) {
     const lineColor = isValid ? '#10B981' : '#EF4444'; // Green or Red
     const pointColor = '#3B82F6'; // Blue centers for neutrality
     
-    ctx.lineWidth = 4;
-    ctx.strokeStyle = lineColor;
-    
-    // Draw lines
-    for (let [i, j] of POSE_CONNECTIONS) {
-        const p1 = keypoints[i];
-        const p2 = keypoints[j];
+    // Bones: accumulate every visible segment into one path and stroke once
+    ctx.beginPath();
+    for (let k = 0; k < POSE_CONNECTIONS.length; k += 2) {
+        const p1 = keypoints[POSE_CONNECTIONS[k]];
+        const p2 = keypoints[POSE_CONNECTIONS[k + 1]];
         if (p1 && p2 && p1[2] > 0.5 && p2[2] > 0.5) {
-            ctx.beginPath();
             ctx.moveTo(p1[0], p1[1]);
             ctx.lineTo(p2[0], p2[1]);
-            ctx.stroke();
         }
     }
+    ctx.lineWidth = 4;
+    ctx.strokeStyle = lineColor;
+    ctx.stroke();
 
-    // Draw points
+    // Joints: one path of circles, filled and outlined in a single pass
+    ctx.beginPath();
     for (let i = 0; i < keypoints.length; i++) {
         const p = keypoints[i];
         if (p && p[2] > 0.5) {
-            ctx.beginPath();
+            ctx.moveTo(p[0] + 5, p[1]);
             ctx.arc(p[0], p[1], 5, 0, 2 * Math.PI);
-            ctx.fillStyle = pointColor; 
-            ctx.fill();
-            ctx.strokeStyle = '#FFFFFF'; 
-            ctx.lineWidth = 2;
-            ctx.stroke();
         }
     }
+    ctx.fillStyle = pointColor;
+    ctx.fill();
+    ctx.strokeStyle = '#FFFFFF';
+    ctx.lineWidth = 2;
+    ctx.stroke();
 }
 
 // Commands